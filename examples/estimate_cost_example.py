@@ -1,12 +1,48 @@
 """Example script demonstrating cost estimation."""
 
+import sys
 from pathlib import Path
-import json
 
 from pcb_cost_estimator import BomParser, CostEstimator
 from pcb_cost_estimator.config import load_config, CostModelConfig
 
 
+# Per-quantity summary block, formatted once per board quantity
+_format_summary = (
+    "Board Quantity: {qty}\n"
+    "{separator}\n"
+    "Total Components: {total_components}\n"
+    "Unique Components: {unique_components}\n"
+    "\n"
+    "Component Costs:\n"
+    "  Low:     ${component_low:.2f}\n"
+    "  Typical: ${component_typical:.2f}\n"
+    "  High:    ${component_high:.2f}\n"
+    "\n"
+    "Assembly Costs:\n"
+    "  Setup:     ${setup:.2f}\n"
+    "  Placement: ${placement:.2f}\n"
+    "  Total:     ${assembly_total:.2f}\n"
+    "\n"
+    "Overhead Costs:\n"
+    "  NRE:        ${nre:.2f}\n"
+    "  Procurement: ${procurement:.2f}\n"
+    "  Total:      ${overhead_total:.2f}\n"
+    "\n"
+    "Total Cost Per Board:\n"
+    "  Low:     ${board_low:.2f}\n"
+    "  Typical: ${board_typical:.2f}\n"
+    "  High:    ${board_high:.2f}\n"
+    "\n"
+    "Total Project Cost:\n"
+    "  Low:     ${project_low:.2f}\n"
+    "  Typical: ${project_typical:.2f}\n"
+    "  High:    ${project_high:.2f}\n"
+    "\n"
+    "\n"
+).format
+
+
 def main():
     """Run cost estimation example."""
     # Parse a sample BoM file
@@ -41,8 +77,10 @@ def main():
     # Create cost estimator
     estimator = CostEstimator(cost_model_config)
 
-    # Estimate costs for different board quantities
+    # Classify and price the BoM once, then reuse it for every board quantity
+    prepared = estimator.prepare(bom_result)
     board_quantities = [1, 10, 100, 1000]
+    estimates = {}
 
     print("=" * 80)
     print("COST ESTIMATION RESULTS")
@@ -50,46 +88,34 @@ def main():
     print()
 
     for qty in board_quantities:
-        print(f"Board Quantity: {qty}")
-        print("-" * 80)
-
-        cost_estimate = estimator.estimate_bom_cost(bom_result, board_quantity=qty)
-
-        # Print summary
-        print(f"Total Components: {cost_estimate.assembly_cost.total_components}")
-        print(f"Unique Components: {cost_estimate.assembly_cost.unique_components}")
-        print()
-
-        print("Component Costs:")
-        print(f"  Low:     ${cost_estimate.total_component_cost_low:.2f}")
-        print(f"  Typical: ${cost_estimate.total_component_cost_typical:.2f}")
-        print(f"  High:    ${cost_estimate.total_component_cost_high:.2f}")
-        print()
-
-        print("Assembly Costs:")
-        print(f"  Setup:     ${cost_estimate.assembly_cost.setup_cost:.2f}")
-        print(f"  Placement: ${cost_estimate.assembly_cost.placement_cost_per_board:.2f}")
-        print(f"  Total:     ${cost_estimate.assembly_cost.total_assembly_cost_per_board:.2f}")
-        print()
-
-        print("Overhead Costs:")
-        print(f"  NRE:        ${cost_estimate.overhead_costs.nre_cost:.2f}")
-        print(f"  Procurement: ${cost_estimate.overhead_costs.procurement_overhead:.2f}")
-        print(f"  Total:      ${cost_estimate.overhead_costs.total_overhead:.2f}")
-        print()
-
-        print("Total Cost Per Board:")
-        print(f"  Low:     ${cost_estimate.total_cost_per_board_low:.2f}")
-        print(f"  Typical: ${cost_estimate.total_cost_per_board_typical:.2f}")
-        print(f"  High:    ${cost_estimate.total_cost_per_board_high:.2f}")
-        print()
-
-        print("Total Project Cost:")
-        print(f"  Low:     ${cost_estimate.total_cost_per_board_low * qty:.2f}")
-        print(f"  Typical: ${cost_estimate.total_cost_per_board_typical * qty:.2f}")
-        print(f"  High:    ${cost_estimate.total_cost_per_board_high * qty:.2f}")
-        print()
-        print()
+        cost_estimate = estimator.apply(prepared, board_quantity=qty)
+        estimates[qty] = cost_estimate
+        assembly = cost_estimate.assembly_cost
+        overhead = cost_estimate.overhead_costs
+
+        sys.stdout.write(
+            _format_summary(
+                qty=qty,
+                separator="-" * 80,
+                total_components=assembly.total_components,
+                unique_components=assembly.unique_components,
+                component_low=cost_estimate.total_component_cost_low,
+                component_typical=cost_estimate.total_component_cost_typical,
+                component_high=cost_estimate.total_component_cost_high,
+                setup=assembly.setup_cost,
+                placement=assembly.placement_cost_per_board,
+                assembly_total=assembly.total_assembly_cost_per_board,
+                nre=overhead.nre_cost,
+                procurement=overhead.procurement_overhead,
+                overhead_total=overhead.total_overhead,
+                board_low=cost_estimate.total_cost_per_board_low,
+                board_typical=cost_estimate.total_cost_per_board_typical,
+                board_high=cost_estimate.total_cost_per_board_high,
+                project_low=cost_estimate.total_cost_per_board_low * qty,
+                project_typical=cost_estimate.total_cost_per_board_typical * qty,
+                project_high=cost_estimate.total_cost_per_board_high * qty,
+            )
+        )
 
     # Show detailed component breakdown for qty=1
     print("=" * 80)
@@ -97,32 +123,39 @@ def main():
     print("=" * 80)
     print()
 
-    cost_estimate = estimator.estimate_bom_cost(bom_result, board_quantity=1)
+    cost_estimate = estimates[1]
 
+    lines = []
     for comp_cost in cost_estimate.component_costs:
-        print(f"Component: {comp_cost.reference_designator}")
-        print(f"  Category: {comp_cost.category}")
-        print(f"  Package:  {comp_cost.package_type}")
-        print(f"  Quantity: {comp_cost.quantity}")
-        print(f"  Unit Cost (typical): ${comp_cost.unit_cost_typical:.4f}")
-        print(f"  Total Cost (typical): ${comp_cost.total_cost_typical:.4f}")
+        lines.append(f"Component: {comp_cost.reference_designator}")
+        lines.append(f"  Category: {comp_cost.category}")
+        lines.append(f"  Package:  {comp_cost.package_type}")
+        lines.append(f"  Quantity: {comp_cost.quantity}")
+        lines.append(f"  Unit Cost (typical): ${comp_cost.unit_cost_typical:.4f}")
+        lines.append(f"  Total Cost (typical): ${comp_cost.total_cost_typical:.4f}")
 
         if comp_cost.manufacturer:
-            print(f"  Manufacturer: {comp_cost.manufacturer}")
+            lines.append(f"  Manufacturer: {comp_cost.manufacturer}")
         if comp_cost.manufacturer_part_number:
-            print(f"  MPN: {comp_cost.manufacturer_part_number}")
+            lines.append(f"  MPN: {comp_cost.manufacturer_part_number}")
 
         # Show quantity breaks
-        print(f"  Quantity Breaks:")
+        lines.append("  Quantity Breaks:")
         for pb in comp_cost.price_breaks:
-            print(f"    {pb.quantity:>6} units: ${pb.unit_price:.4f}/unit, ${pb.total_price:.2f} total")
+            lines.append(
+                f"    {pb.quantity:>6} units: ${pb.unit_price:.4f}/unit, "
+                f"${pb.total_price:.2f} total"
+            )
+
+        lines.append("")
 
-        print()
+    # One write for the whole breakdown instead of one print per line
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Export to JSON
     output_file = Path("cost_estimate.json")
-    with open(output_file, "w") as f:
-        json.dump(cost_estimate.model_dump(), f, indent=2, default=str)
+    output_file.write_text(cost_estimate.model_dump_json(indent=2))
     print(f"Full cost estimate exported to: {output_file}")
 
 
@@ -5,17 +5,23 @@ This example shows how to use the reporting module to generate
 cost reports in multiple formats: CLI table, JSON, CSV, and Markdown.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
 from pathlib import Path
 import sys
 
-# Add src to path if running directly
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path if running directly from a checkout without the package installed
+if importlib.util.find_spec("pcb_cost_estimator") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from pcb_cost_estimator.bom_parser import BomParser
 from pcb_cost_estimator.cost_estimator import CostEstimator
 from pcb_cost_estimator.reporting import generate_report
 from pcb_cost_estimator.config import load_cost_model_config
 
+# Large write buffer so multi-megabyte reports go out in a few write() calls
+REPORT_BUFFER_SIZE = 1 << 20
+
 
 def main():
     """Run report generation example."""
@@ -58,26 +64,40 @@ def main():
     print("-" * 80)
     generate_report(cost_estimate, format='table')
 
-    # 2. JSON Report
+    # 2-4. File-backed reports are independent of each other, so write them
+    # concurrently; only the CLI table above needs to stay on the main thread.
     json_path = output_dir / "cost_report.json"
+    csv_path = output_dir / "cost_report.csv"
+    md_path = output_dir / "cost_report.md"
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        json_future = executor.submit(
+            generate_report, cost_estimate, format='json', output_path=json_path,
+            buffer_size=REPORT_BUFFER_SIZE
+        )
+        csv_future = executor.submit(
+            generate_report, cost_estimate, format='csv', output_path=csv_path,
+            buffer_size=REPORT_BUFFER_SIZE
+        )
+        md_future = executor.submit(
+            generate_report, cost_estimate, format='markdown', output_path=md_path,
+            buffer_size=REPORT_BUFFER_SIZE
+        )
+        json_report = json_future.result()
+        csv_future.result()
+        md_future.result()
+
     print(f"\n2. JSON Report")
-    print(f"   Generating: {json_path}")
-    json_report = generate_report(cost_estimate, format='json', output_path=json_path)
+    print(f"   Generated: {json_path}")
     print(f"   ✓ Generated with {len(json_report['itemized_components'])} components")
     print(f"   ✓ {len(json_report['volume_tier_comparison']['tiers'])} volume tiers")
 
-    # 3. CSV Export
-    csv_path = output_dir / "cost_report.csv"
     print(f"\n3. CSV Export")
-    print(f"   Generating: {csv_path}")
-    generate_report(cost_estimate, format='csv', output_path=csv_path)
+    print(f"   Generated: {csv_path}")
     print(f"   ✓ Generated - import into Excel/Google Sheets")
 
-    # 4. Markdown Report
-    md_path = output_dir / "cost_report.md"
     print(f"\n4. Markdown Report")
-    print(f"   Generating: {md_path}")
-    generate_report(cost_estimate, format='markdown', output_path=md_path)
+    print(f"   Generated: {md_path}")
     print(f"   ✓ Generated - human-readable documentation")
 
     print("\n" + "=" * 80)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Example script demonstrating BoM parser usage."""
 
+from collections import Counter
 from pathlib import Path
 from pcb_cost_estimator.bom_parser import BomParser
 from pcb_cost_estimator.models import ComponentCategory
@@ -51,10 +52,20 @@ def main():
             for error in result.errors:
                 print(f"   - {error}")
 
+        # Collect the sample rows and the category/DNP tallies in one pass
+        sample_items = []
+        categories = Counter()
+        dnp_count = 0
+        for idx, item in enumerate(result.items):
+            if idx < 5:
+                sample_items.append(item)
+            categories[item.category] += 1
+            dnp_count += item.dnp
+
         # Display sample items
         if result.items:
             print(f"\n📋 Sample Items (showing first 5):")
-            for item in result.items[:5]:
+            for item in sample_items:
                 dnp_marker = " [DNP]" if item.dnp else ""
                 print(f"   {item.reference_designator:10} "
                       f"Qty: {item.quantity:2} "
@@ -64,16 +75,8 @@ def main():
             if len(result.items) > 5:
                 print(f"   ... and {len(result.items) - 5} more items")
 
-            # Category breakdown
-            categories = {}
-            dnp_count = 0
-            for item in result.items:
-                categories[item.category] = categories.get(item.category, 0) + 1
-                if item.dnp:
-                    dnp_count += 1
-
             print(f"\n📊 Category Breakdown:")
-            for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+            for category, count in categories.most_common():
                 print(f"   {category:15}: {count:3} item(s)")
 
             if dnp_count > 0:
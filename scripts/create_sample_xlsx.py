@@ -3,6 +3,7 @@
 
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
 from pathlib import Path
 
 
@@ -46,22 +47,18 @@ def create_complex_bom():
         ["D30", 2, "Diodes Inc", "1N4148W-7-F", "Switching Diode", "SOD-123", "100V"],
     ]
 
-    for row_idx, row_data in enumerate(bom_data, start=7):
-        for col_idx, value in enumerate(row_data, start=1):
-            ws.cell(row=row_idx, column=col_idx, value=value)
+    # Track the widest value per column while appending rows
+    widths = [len(header) for header in headers]
+    for row_data in bom_data:
+        ws.append(row_data)
+        widths = [
+            max(width, len(str(value)) if value is not None else 0)
+            for width, value in zip(widths, row_data)
+        ]
 
     # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if cell.value and len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
+    for col_idx, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 2, 50)
 
     # Save file
     output_path = Path(__file__).parent.parent / "data" / "sample_boms" / "complex_layout.xlsx"
@@ -93,9 +90,8 @@ def create_merged_cells_bom():
         ["C40", 1, "Murata", "GRM188R71C104KA01", "100nF Cap", "0603", "100nF"],
     ]
 
-    for row_idx, row_data in enumerate(data, start=4):
-        for col_idx, value in enumerate(row_data, start=1):
-            ws.cell(row=row_idx, column=col_idx, value=value)
+    for row_data in data:
+        ws.append(row_data)
 
     output_path = Path(__file__).parent.parent / "data" / "sample_boms" / "merged_cells.xlsx"
     wb.save(output_path)
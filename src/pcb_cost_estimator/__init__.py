@@ -1,34 +1,53 @@
 """PCB Cost Estimator - AI-powered PCB cost estimation tool."""
 
+import importlib
+from typing import Any, List
+
 __version__ = "0.1.0"
 
-from .models import (
-    BomItem,
-    BomParseResult,
-    ComponentCategory,
-    PackageType,
-    PriceBreak,
-    ComponentCostEstimate,
-    AssemblyCost,
-    OverheadCosts,
-    CostEstimate,
-)
-from .bom_parser import BomParser, ColumnMatcher
-from .cost_estimator import CostEstimator, ComponentClassifier, PackageClassifier
-
-__all__ = [
-    "BomItem",
-    "BomParseResult",
-    "ComponentCategory",
-    "PackageType",
-    "PriceBreak",
-    "ComponentCostEstimate",
-    "AssemblyCost",
-    "OverheadCosts",
-    "CostEstimate",
-    "BomParser",
-    "ColumnMatcher",
-    "CostEstimator",
-    "ComponentClassifier",
-    "PackageClassifier",
-]
+# Submodule -> public symbols it defines. Submodules are imported on first
+# attribute access (PEP 562) so that e.g. ``from pcb_cost_estimator import BomParser``
+# does not pay for the cost engine or LLM stack.
+_SUBMODULE_EXPORTS = {
+    ".models": (
+        "BomItem",
+        "BomParseResult",
+        "ComponentCategory",
+        "PackageType",
+        "PriceBreak",
+        "ComponentCostEstimate",
+        "AssemblyCost",
+        "OverheadCosts",
+        "CostEstimate",
+    ),
+    ".bom_parser": ("BomParser", "ColumnMatcher"),
+    ".cost_estimator": (
+        "CostEstimator",
+        "ComponentClassifier",
+        "PackageClassifier",
+        "PreparedBom",
+    ),
+}
+
+_LAZY_IMPORTS = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public symbols from their submodule on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List eagerly bound globals plus the lazily resolved public symbols."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,14 +1,89 @@
 """BoM parser module with support for CSV, XLSX, and TSV formats."""
 
 import csv
+import io
+import math
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Sequence
 import pandas as pd
+from pandas.io.parsers import TextFileReader
 from difflib import SequenceMatcher
 
+from .keyword_scanner import KeywordScanner
 from .models import BomItem, BomParseResult, ComponentCategory
 
+# Optional C++ fuzzy matcher; difflib is used when it is not installed
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_REF_PREFIX_RE = re.compile(r"^([A-Za-z]+)")
+
+
+@lru_cache(maxsize=1024)
+def _normalize_column_name(name: str) -> str:
+    """Lowercase a column name and collapse punctuation/whitespace runs."""
+    normalized = _NON_WORD_RE.sub(" ", name.lower())
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+def _flatten_patterns(column_patterns: dict[str, list[str]]) -> tuple[tuple[str, str], ...]:
+    """Flatten canonical -> variations into ordered (canonical, pattern) pairs."""
+    return tuple(
+        (canonical, pattern)
+        for canonical, patterns in column_patterns.items()
+        for pattern in patterns
+    )
+
+
+@lru_cache(maxsize=2048)
+def _match_column_name(
+    matcher: "type[ColumnMatcher]", normalized: str, threshold: float
+) -> Optional[str]:
+    """Match a normalized column name against a ColumnMatcher class's patterns.
+
+    Header detection re-matches the same cells for every candidate row, and the
+    winning row is matched again when mapping columns, so results are cached.
+    The matcher class is part of the key, so subclasses keep their own patterns.
+    """
+    # Exact match gets priority
+    exact = matcher._EXACT_MATCHES.get(normalized)
+    if exact is not None:
+        return exact
+
+    if RAPIDFUZZ_AVAILABLE:
+        # Best-scoring pattern in a single C++ call
+        match = process.extractOne(
+            normalized,
+            matcher._PATTERN_CHOICES,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold * 100,
+        )
+        return matcher._FLAT_PATTERNS[match[2]][0] if match else None
+
+    best_match = None
+    best_score = 0.0
+
+    for canonical, pattern in matcher._FLAT_PATTERNS:
+        # Fuzzy match using sequence matcher
+        score = SequenceMatcher(None, normalized, pattern).ratio()
+        if score > best_score:
+            best_score = score
+            best_match = canonical
+
+    # Only return match if it meets threshold
+    if best_score >= threshold:
+        return best_match
+
+    return None
+
 
 class ColumnMatcher:
     """Fuzzy column name matcher for BoM files.
@@ -93,13 +168,26 @@ class ColumnMatcher:
         ],
     }
 
+    # Flat (canonical, pattern) pairs in declaration order, plus an exact-match index
+    _FLAT_PATTERNS = _flatten_patterns(COLUMN_PATTERNS)
+    _EXACT_MATCHES = {pattern: canonical for canonical, pattern in reversed(_FLAT_PATTERNS)}
+    _PATTERN_CHOICES = tuple(pattern for _, pattern in _FLAT_PATTERNS)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Rebuild the pattern indexes for subclasses that override COLUMN_PATTERNS."""
+        super().__init_subclass__(**kwargs)
+        if "COLUMN_PATTERNS" in cls.__dict__:
+            cls._FLAT_PATTERNS = _flatten_patterns(cls.COLUMN_PATTERNS)
+            cls._EXACT_MATCHES = {
+                pattern: canonical for canonical, pattern in reversed(cls._FLAT_PATTERNS)
+            }
+            cls._PATTERN_CHOICES = tuple(pattern for _, pattern in cls._FLAT_PATTERNS)
+
     @classmethod
     def normalize_column_name(cls, name: str) -> str:
         """Normalize a column name for comparison."""
         # Convert to lowercase, remove extra whitespace and special chars
-        normalized = re.sub(r"[^\w\s]", " ", name.lower())
-        normalized = re.sub(r"\s+", " ", normalized).strip()
-        return normalized
+        return _normalize_column_name(name)
 
     @classmethod
     def find_best_match(cls, column_name: str, threshold: float = 0.6) -> Optional[str]:
@@ -112,28 +200,7 @@ class ColumnMatcher:
         Returns:
             Canonical column name or None if no good match found
         """
-        normalized = cls.normalize_column_name(column_name)
-
-        best_match = None
-        best_score = 0.0
-
-        for canonical, patterns in cls.COLUMN_PATTERNS.items():
-            for pattern in patterns:
-                # Exact match gets priority
-                if normalized == pattern:
-                    return canonical
-
-                # Fuzzy match using sequence matcher
-                score = SequenceMatcher(None, normalized, pattern).ratio()
-                if score > best_score:
-                    best_score = score
-                    best_match = canonical
-
-        # Only return match if it meets threshold
-        if best_score >= threshold:
-            return best_match
-
-        return None
+        return _match_column_name(cls, cls.normalize_column_name(column_name), threshold)
 
     @classmethod
     def map_columns(cls, columns: list[str]) -> dict[str, str]:
@@ -156,15 +223,74 @@ class ColumnMatcher:
 class BomParser:
     """Parser for Bill of Materials files in various formats."""
 
-    SUPPORTED_EXTENSIONS = {".csv", ".tsv", ".xlsx", ".xls"}
+    SUPPORTED_EXTENSIONS = frozenset({".csv", ".tsv", ".xlsx", ".xls"})
+    _SUPPORTED_EXTENSIONS_TEXT = ", ".join(sorted(SUPPORTED_EXTENSIONS))
+
+    # Markers that flag a row as do-not-place, matched anywhere in the row
+    DNP_MARKERS = ("dnp", "dni", "do not place", "do not install", "not fitted", "no place")
+
+    # Reference designator prefix -> category
+    REF_PREFIX_CATEGORIES = {
+        "R": ComponentCategory.RESISTOR,
+        "C": ComponentCategory.CAPACITOR,
+        "L": ComponentCategory.INDUCTOR,
+        "U": ComponentCategory.IC,
+        "IC": ComponentCategory.IC,
+        "J": ComponentCategory.CONNECTOR,
+        "P": ComponentCategory.CONNECTOR,
+        "D": ComponentCategory.DIODE,
+        "Q": ComponentCategory.TRANSISTOR,
+        "LED": ComponentCategory.LED,
+        "Y": ComponentCategory.CRYSTAL,
+        "X": ComponentCategory.CRYSTAL,
+        "SW": ComponentCategory.SWITCH,
+        "S": ComponentCategory.SWITCH,
+        "K": ComponentCategory.RELAY,
+        "F": ComponentCategory.FUSE,
+        "T": ComponentCategory.TRANSFORMER,
+    }
+
+    # Description/value keywords per category, checked in declaration order
+    CATEGORY_KEYWORDS = {
+        ComponentCategory.RESISTOR: ["resistor", "ohm", "kohm", "mohm"],
+        ComponentCategory.CAPACITOR: ["capacitor", "farad", "uf", "nf", "pf"],
+        ComponentCategory.INDUCTOR: ["inductor", "henry", "uh", "mh"],
+        ComponentCategory.IC: ["ic", "chip", "processor", "controller", "regulator"],
+        ComponentCategory.CONNECTOR: ["connector", "header", "socket", "plug"],
+        ComponentCategory.DIODE: ["diode", "rectifier"],
+        ComponentCategory.TRANSISTOR: ["transistor", "mosfet", "bjt", "fet"],
+        ComponentCategory.LED: ["led", "light emitting"],
+        ComponentCategory.CRYSTAL: ["crystal", "oscillator", "resonator"],
+        ComponentCategory.SWITCH: ["switch", "button"],
+        ComponentCategory.RELAY: ["relay"],
+        ComponentCategory.FUSE: ["fuse"],
+        ComponentCategory.TRANSFORMER: ["transformer"],
+    }
 
-    def __init__(self, max_header_search_rows: int = 10):
+    # Exact category cell values; "unknown" is left out so those rows are inferred
+    _CATEGORY_BY_VALUE = {
+        category.value: category
+        for category in ComponentCategory
+        if category is not ComponentCategory.UNKNOWN
+    }
+    _DNP_RE = re.compile("|".join(re.escape(marker) for marker in DNP_MARKERS))
+    _CATEGORY_SCANNER = KeywordScanner(
+        (keyword, category)
+        for category, keywords in CATEGORY_KEYWORDS.items()
+        for keyword in keywords
+    )
+
+    def __init__(self, max_header_search_rows: int = 10, chunksize: Optional[int] = None):
         """Initialize the BoM parser.
 
         Args:
             max_header_search_rows: Maximum number of rows to search for headers
+            chunksize: If set, read CSV/TSV files this many rows at a time so that
+                memory use does not grow with the file size. Excel files are
+                always read whole.
         """
         self.max_header_search_rows = max_header_search_rows
+        self.chunksize = chunksize
 
     def parse_file(self, file_path: str | Path) -> BomParseResult:
         """Parse a BoM file and return normalized items.
@@ -186,7 +312,7 @@ class BomParser:
         if extension not in self.SUPPORTED_EXTENSIONS:
             result.errors.append(
                 f"Unsupported file format: {extension}. "
-                f"Supported: {', '.join(self.SUPPORTED_EXTENSIONS)}"
+                f"Supported: {self._SUPPORTED_EXTENSIONS_TEXT}"
             )
             return result
 
@@ -202,6 +328,11 @@ class BomParser:
                 result.errors.append(f"Unexpected file extension: {extension}")
                 return result
 
+            if isinstance(df, TextFileReader):
+                with df as chunks:
+                    self._parse_chunks(chunks, result)
+                return result
+
             if df is None or df.empty:
                 result.errors.append("File is empty or could not be read")
                 return result
@@ -214,15 +345,36 @@ class BomParser:
 
         return result
 
-    def _read_csv(self, path: Path) -> Optional[pd.DataFrame]:
+    def parse_files(
+        self, file_paths: Iterable[str | Path], max_workers: Optional[int] = None
+    ) -> list[BomParseResult]:
+        """Parse several BoM files in parallel, one process per file.
+
+        Args:
+            file_paths: Paths to the BoM files
+            max_workers: Maximum number of worker processes (defaults to the CPU count)
+
+        Returns:
+            One BomParseResult per file, in the same order as file_paths
+        """
+        paths = list(file_paths)
+        if len(paths) <= 1 or max_workers == 1:
+            return [self.parse_file(path) for path in paths]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.parse_file, paths))
+
+    def _read_csv(self, path: Path) -> Optional[pd.DataFrame | TextFileReader]:
         """Read CSV file with header detection."""
         return self._read_delimited(path, delimiter=",")
 
-    def _read_tsv(self, path: Path) -> Optional[pd.DataFrame]:
+    def _read_tsv(self, path: Path) -> Optional[pd.DataFrame | TextFileReader]:
         """Read TSV file with header detection."""
         return self._read_delimited(path, delimiter="\t")
 
-    def _read_delimited(self, path: Path, delimiter: str) -> Optional[pd.DataFrame]:
+    def _read_delimited(
+        self, path: Path, delimiter: str
+    ) -> Optional[pd.DataFrame | TextFileReader]:
         """Read delimited file with automatic header detection.
 
         Args:
@@ -230,19 +382,49 @@ class BomParser:
             delimiter: Field delimiter
 
         Returns:
-            DataFrame or None if read fails
+            DataFrame, a chunk iterator if chunksize is set, or None if read fails
         """
-        # Try to detect header row
-        header_row = self._detect_header_row(path, delimiter)
-
-        # Read the file
-        df = pd.read_csv(
-            path,
-            delimiter=delimiter,
-            skiprows=header_row,
-            dtype=str,
-            keep_default_na=False,
-        )
+        if self.chunksize is not None:
+            # Only the first rows are read up front; pandas streams the rest
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                header_row = self._detect_header_row(f, delimiter)
+            return pd.read_csv(
+                path,
+                delimiter=delimiter,
+                skiprows=header_row,
+                dtype=str,
+                keep_default_na=False,
+                chunksize=self.chunksize,
+            )
+
+        # Read the file once; header detection and pandas both work from memory
+        data = path.read_bytes()
+        text = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="ignore")
+        header_row = self._detect_header_row(text, delimiter)
+
+        # Prefer the multi-threaded pyarrow engine. It is stricter than the C engine
+        # (ragged rows raise) and does not de-duplicate repeated column names, so
+        # fall back to the C engine in either case.
+        try:
+            df = pd.read_csv(
+                io.BytesIO(data),
+                delimiter=delimiter,
+                header=header_row,
+                dtype=str,
+                keep_default_na=False,
+                engine="pyarrow",
+            )
+        except (ImportError, ValueError):
+            df = None
+
+        if df is None or df.columns.duplicated().any():
+            df = pd.read_csv(
+                io.BytesIO(data),
+                delimiter=delimiter,
+                skiprows=header_row,
+                dtype=str,
+                keep_default_na=False,
+            )
 
         return df
 
@@ -255,41 +437,60 @@ class BomParser:
         Returns:
             DataFrame or None if read fails
         """
-        # Read a preview to detect header
-        preview = pd.read_excel(path, nrows=self.max_header_search_rows, dtype=str)
-
-        header_row = 0
-        for idx in range(min(self.max_header_search_rows, len(preview))):
-            row_values = preview.iloc[idx].astype(str).tolist()
-            if self._looks_like_header(row_values):
-                header_row = idx
-                break
+        # Legacy .xls workbooks cannot be opened with openpyxl
+        if path.suffix.lower() == ".xls":
+            preview = pd.read_excel(
+                path, header=None, nrows=self.max_header_search_rows, dtype=str
+            )
+            header_row = self._find_header_row(preview.itertuples(index=False, name=None))
+            return pd.read_excel(path, header=header_row, dtype=str, keep_default_na=False)
 
-        # Read the full file with detected header
-        df = pd.read_excel(path, skiprows=header_row, dtype=str, keep_default_na=False)
+        import openpyxl
+
+        # Open the workbook once: stream the first rows for header detection, then
+        # hand the same workbook to pandas for the full read
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
+        try:
+            sheet = workbook.worksheets[0]
+            header_row = self._find_header_row(
+                sheet.iter_rows(max_row=self.max_header_search_rows, values_only=True)
+            )
+            df = pd.read_excel(
+                workbook, header=header_row, dtype=str, keep_default_na=False, engine="openpyxl"
+            )
+        finally:
+            workbook.close()
 
         return df
 
-    def _detect_header_row(self, path: Path, delimiter: str) -> int:
+    def _find_header_row(self, rows: Iterable[Sequence[Any]]) -> int:
+        """Return the index of the first row that looks like a header.
+
+        Args:
+            rows: Raw rows from the top of the sheet
+
+        Returns:
+            Row index of the header (0-based), or 0 if none is found
+        """
+        for idx, row in enumerate(rows):
+            if idx >= self.max_header_search_rows:
+                break
+            if self._looks_like_header(list(row)):
+                return idx
+
+        return 0
+
+    def _detect_header_row(self, lines: Iterable[str], delimiter: str) -> int:
         """Detect which row contains the column headers.
 
         Args:
-            path: Path to the file
+            lines: Text lines from the start of the file
             delimiter: Field delimiter
 
         Returns:
             Row index of the header (0-based)
         """
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            reader = csv.reader(f, delimiter=delimiter)
-            for idx, row in enumerate(reader):
-                if idx >= self.max_header_search_rows:
-                    break
-                if self._looks_like_header(row):
-                    return idx
-
-        # Default to first row
-        return 0
+        return self._find_header_row(csv.reader(lines, delimiter=delimiter))
 
     def _looks_like_header(self, row: list[str]) -> bool:
         """Check if a row looks like a header row.
@@ -309,14 +510,16 @@ class BomParser:
         if len(non_empty) < 2:
             return False
 
-        # Check if any column name matches known patterns
+        # If at least 2 columns match known patterns, it's likely a header; stop
+        # matching as soon as the second one is found
         matches = 0
         for cell in non_empty:
             if ColumnMatcher.find_best_match(str(cell), threshold=0.5):
                 matches += 1
+                if matches >= 2:
+                    return True
 
-        # If at least 2 columns match known patterns, it's likely a header
-        return matches >= 2
+        return False
 
     def _parse_dataframe(self, df: pd.DataFrame, result: BomParseResult) -> None:
         """Parse a DataFrame into BomItem objects.
@@ -325,14 +528,51 @@ class BomParser:
             df: DataFrame to parse
             result: BomParseResult to populate
         """
+        reverse_mapping = self._map_columns(df.columns.tolist(), result)
+        if reverse_mapping is not None:
+            self._parse_rows(df, reverse_mapping, result)
+
+    def _parse_chunks(self, chunks: Iterable[pd.DataFrame], result: BomParseResult) -> None:
+        """Parse a file read in chunks, mapping columns from the first chunk.
+
+        Args:
+            chunks: DataFrames sharing the same columns, in file order
+            result: BomParseResult to populate
+        """
+        reverse_mapping = None
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            if reverse_mapping is None:
+                reverse_mapping = self._map_columns(chunk.columns.tolist(), result)
+                if reverse_mapping is None:
+                    return
+            self._parse_rows(chunk, reverse_mapping, result)
+
+        if reverse_mapping is None:
+            result.errors.append("File is empty or could not be read")
+
+    def _map_columns(
+        self, columns: list[str], result: BomParseResult
+    ) -> Optional[dict[str, str]]:
+        """Map file columns to canonical field names.
+
+        Args:
+            columns: Column names from the file
+            result: BomParseResult to record errors and warnings on
+
+        Returns:
+            Mapping from canonical names to column names, or None if no BoM
+            columns were recognised
+        """
         # Map columns to canonical names
-        column_mapping = ColumnMatcher.map_columns(df.columns.tolist())
+        column_mapping = ColumnMatcher.map_columns(columns)
 
         if not column_mapping:
             result.errors.append(
                 "Could not identify any BoM columns. Please check the file format."
             )
-            return
+            return None
 
         # Check for required fields
         if "reference_designator" not in column_mapping.values():
@@ -344,24 +584,28 @@ class BomParser:
             result.warnings.append("No quantity column found. Defaulting to 1 for all items.")
 
         # Reverse mapping for easy lookup
-        reverse_mapping = {v: k for k, v in column_mapping.items()}
+        return {v: k for k, v in column_mapping.items()}
 
-        # Process each row
-        for idx, row in df.iterrows():
-            result.total_rows_processed += 1
+    def _parse_rows(
+        self, df: pd.DataFrame, reverse_mapping: dict[str, str], result: BomParseResult
+    ) -> None:
+        """Parse the rows of a DataFrame into BomItem objects.
 
-            try:
-                # Extract fields using mapped columns
-                item_data = self._extract_item_data(
-                    row, reverse_mapping, idx, result.total_rows_processed
-                )
+        Args:
+            df: DataFrame to parse
+            reverse_mapping: Mapping from canonical names to column names
+            result: BomParseResult to populate
+        """
+        # Extract every field column-wise, then build items row by row
+        fields = self._extract_fields(df, reverse_mapping)
+        fields["dnp"] = self._detect_dnp(df)
+        names = list(fields)
 
-                # Check for DNP markers
-                item_data["dnp"] = self._check_dnp(row, item_data)
+        for values in zip(*fields.values()):
+            result.total_rows_processed += 1
 
-                # Infer category from description/value
-                if not item_data.get("category") or item_data["category"] == "unknown":
-                    item_data["category"] = self._infer_category(item_data)
+            try:
+                item_data = dict(zip(names, values), line_number=result.total_rows_processed)
 
                 # Create BomItem
                 item = BomItem(**item_data)
@@ -376,44 +620,42 @@ class BomParser:
                     f"Row {result.total_rows_processed}: Failed to parse - {str(e)}"
                 )
 
-    def _extract_item_data(
-        self,
-        row: pd.Series,
-        reverse_mapping: dict[str, str],
-        idx: int,
-        line_number: int,
-    ) -> dict[str, Any]:
-        """Extract item data from a DataFrame row.
+    def _extract_fields(
+        self, df: pd.DataFrame, reverse_mapping: dict[str, str]
+    ) -> dict[str, list[Any]]:
+        """Extract item fields from a DataFrame using column-wise string operations.
 
         Args:
-            row: DataFrame row
+            df: DataFrame to extract from
             reverse_mapping: Mapping from canonical names to column names
-            idx: Row index
-            line_number: Line number in source file
 
         Returns:
-            Dictionary of item data
+            Mapping from field name to its per-row values, in row order
         """
-        data: dict[str, Any] = {"line_number": line_number}
+        # Strip every mapped column once up front
+        columns = {
+            field: df[col].astype(str).str.strip() for field, col in reverse_mapping.items()
+        }
+        blank = pd.Series("", index=df.index, dtype=str)
+
+        labels = pd.Series(df.index.map(str), index=df.index)
+        fields: dict[str, list[Any]] = {}
 
         # Reference designator
         if "reference_designator" in reverse_mapping:
-            col = reverse_mapping["reference_designator"]
-            data["reference_designator"] = str(row[col]).strip() or f"UNKNOWN_{idx}"
+            refs = columns["reference_designator"]
+            refs = refs.mask(refs == "", "UNKNOWN_" + labels)
         else:
-            data["reference_designator"] = f"ROW_{idx}"
+            refs = "ROW_" + labels
+        fields["reference_designator"] = refs.tolist()
 
-        # Quantity
+        # Quantity, truncated towards zero; blank or unparseable values default to 1.
+        # Non-finite values are passed through for BomItem validation to reject.
         if "quantity" in reverse_mapping:
-            col = reverse_mapping["quantity"]
-            qty_str = str(row[col]).strip()
-            # Try to parse quantity, default to 1
-            try:
-                data["quantity"] = int(float(qty_str)) if qty_str else 1
-            except (ValueError, TypeError):
-                data["quantity"] = 1
+            quantities = pd.to_numeric(columns["quantity"], errors="coerce").fillna(1)
+            fields["quantity"] = [int(q) if math.isfinite(q) else q for q in quantities]
         else:
-            data["quantity"] = 1
+            fields["quantity"] = [1] * len(df)
 
         # Optional fields
         for field in [
@@ -423,115 +665,67 @@ class BomParser:
             "package",
             "value",
         ]:
-            if field in reverse_mapping:
-                col = reverse_mapping[field]
-                value = str(row[col]).strip()
-                data[field] = value if value else None
+            if field in columns:
+                fields[field] = [value or None for value in columns[field]]
 
-        # Category
+        # Category cells must name a category exactly; anything else is inferred
         if "category" in reverse_mapping:
-            col = reverse_mapping["category"]
-            cat_str = str(row[col]).strip().lower()
-            # Try to match to enum
-            for cat in ComponentCategory:
-                if cat.value in cat_str or cat_str in cat.value:
-                    data["category"] = cat
-                    break
+            categories = columns["category"].str.lower().map(self._CATEGORY_BY_VALUE)
+        else:
+            categories = pd.Series(None, index=df.index, dtype=object)
+        categories = self._infer_categories(
+            categories,
+            refs,
+            columns.get("description", blank),
+            columns.get("value", blank),
+        )
+        fields["category"] = categories.tolist()
 
-        return data
+        return fields
 
-    def _check_dnp(self, row: pd.Series, item_data: dict[str, Any]) -> bool:
-        """Check if item is marked as DNP/DNI.
+    def _infer_categories(
+        self,
+        categories: pd.Series,
+        refs: pd.Series,
+        descriptions: pd.Series,
+        values: pd.Series,
+    ) -> pd.Series:
+        """Fill in missing categories from the available data.
+
+        The reference designator prefix is tried first, then keywords in the
+        description and value.
 
         Args:
-            row: DataFrame row
-            item_data: Extracted item data
+            categories: Known categories, missing where unknown
+            refs: Reference designators
+            descriptions: Stripped descriptions ("" when absent)
+            values: Stripped values ("" when absent)
 
         Returns:
-            True if item is DNP/DNI
+            Categories with every row filled in
         """
-        # Check all row values for DNP markers
-        row_str = " ".join(str(v).lower() for v in row.values)
-        dnp_markers = ["dnp", "dni", "do not place", "do not install", "not fitted", "no place"]
-
-        for marker in dnp_markers:
-            if marker in row_str:
-                return True
-
-        # Check description and notes specifically
-        for field in ["description", "notes"]:
-            if field in item_data and item_data[field]:
-                value_lower = str(item_data[field]).lower()
-                for marker in dnp_markers:
-                    if marker in value_lower:
-                        return True
+        prefixes = refs.str.extract(_REF_PREFIX_RE, expand=False).str.upper()
+        categories = categories.fillna(prefixes.map(self.REF_PREFIX_CATEGORIES))
 
-        return False
+        missing = categories.isna()
+        if missing.any():
+            combined = descriptions[missing].str.cat(values[missing], sep=" ").str.lower()
+            categories[missing] = [
+                self._CATEGORY_SCANNER.find(text) or ComponentCategory.UNKNOWN
+                for text in combined
+            ]
 
-    def _infer_category(self, item_data: dict[str, Any]) -> ComponentCategory:
-        """Infer component category from available data.
+        return categories
+
+    def _detect_dnp(self, df: pd.DataFrame) -> list[bool]:
+        """Flag rows that carry a DNP/DNI marker in any column.
 
         Args:
-            item_data: Item data dictionary
+            df: DataFrame to scan
 
         Returns:
-            Inferred ComponentCategory
+            One flag per row, True if the item is DNP/DNI
         """
-        # Get reference designator prefix
-        ref_des = item_data.get("reference_designator", "")
-        prefix = re.match(r"^([A-Za-z]+)", ref_des)
-
-        if prefix:
-            prefix_str = prefix.group(1).upper()
-
-            # Common prefix mappings
-            prefix_map = {
-                "R": ComponentCategory.RESISTOR,
-                "C": ComponentCategory.CAPACITOR,
-                "L": ComponentCategory.INDUCTOR,
-                "U": ComponentCategory.IC,
-                "IC": ComponentCategory.IC,
-                "J": ComponentCategory.CONNECTOR,
-                "P": ComponentCategory.CONNECTOR,
-                "D": ComponentCategory.DIODE,
-                "Q": ComponentCategory.TRANSISTOR,
-                "LED": ComponentCategory.LED,
-                "Y": ComponentCategory.CRYSTAL,
-                "X": ComponentCategory.CRYSTAL,
-                "SW": ComponentCategory.SWITCH,
-                "S": ComponentCategory.SWITCH,
-                "K": ComponentCategory.RELAY,
-                "F": ComponentCategory.FUSE,
-                "T": ComponentCategory.TRANSFORMER,
-            }
-
-            if prefix_str in prefix_map:
-                return prefix_map[prefix_str]
-
-        # Check description for keywords
-        desc = str(item_data.get("description", "")).lower()
-        value = str(item_data.get("value", "")).lower()
-        combined = f"{desc} {value}"
-
-        category_keywords = {
-            ComponentCategory.RESISTOR: ["resistor", "ohm", "kohm", "mohm"],
-            ComponentCategory.CAPACITOR: ["capacitor", "farad", "uf", "nf", "pf"],
-            ComponentCategory.INDUCTOR: ["inductor", "henry", "uh", "mh"],
-            ComponentCategory.IC: ["ic", "chip", "processor", "controller", "regulator"],
-            ComponentCategory.CONNECTOR: ["connector", "header", "socket", "plug"],
-            ComponentCategory.DIODE: ["diode", "rectifier"],
-            ComponentCategory.TRANSISTOR: ["transistor", "mosfet", "bjt", "fet"],
-            ComponentCategory.LED: ["led", "light emitting"],
-            ComponentCategory.CRYSTAL: ["crystal", "oscillator", "resonator"],
-            ComponentCategory.SWITCH: ["switch", "button"],
-            ComponentCategory.RELAY: ["relay"],
-            ComponentCategory.FUSE: ["fuse"],
-            ComponentCategory.TRANSFORMER: ["transformer"],
-        }
-
-        for category, keywords in category_keywords.items():
-            for keyword in keywords:
-                if keyword in combined:
-                    return category
-
-        return ComponentCategory.UNKNOWN
+        cells = [series.astype(str) for _, series in df.items()]
+        row_text = cells[0].str.cat(cells[1:], sep=" ").str.lower()
+        return row_text.str.contains(self._DNP_RE, regex=True).tolist()
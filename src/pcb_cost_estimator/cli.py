@@ -9,12 +9,15 @@ from typing import Optional
 import click
 
 from pcb_cost_estimator import __version__
-from pcb_cost_estimator.config import load_config
 from pcb_cost_estimator.logger import setup_logging
-from pcb_cost_estimator.bom_parser import BomParser
-from pcb_cost_estimator.cost_estimator import CostEstimator
-from pcb_cost_estimator.llm_enrichment import create_enrichment_service
-from pcb_cost_estimator.reporting import generate_report
+
+# Report format implied by an --output file extension
+REPORT_FORMATS_BY_EXTENSION = {
+    ".json": "json",
+    ".csv": "csv",
+    ".md": "markdown",
+    ".markdown": "markdown",
+}
 
 
 @click.group()
@@ -42,6 +45,10 @@ def main(ctx: click.Context, config: Path, verbose: bool) -> None:
     # Ensure context object exists
     ctx.ensure_object(dict)
 
+    # Nothing to set up while the shell is only asking for completions
+    if ctx.resilient_parsing:
+        return
+
     # Set up logging
     log_level = logging.DEBUG if verbose else logging.INFO
     setup_logging(log_level)
@@ -49,7 +56,10 @@ def main(ctx: click.Context, config: Path, verbose: bool) -> None:
     logger = logging.getLogger(__name__)
     logger.info(f"PCB Cost Estimator v{__version__}")
 
-    # Load configuration
+    # Load configuration. Imported here so --help and --version do not load
+    # PyYAML and pydantic
+    from pcb_cost_estimator.config import load_config
+
     try:
         ctx.obj["config"] = load_config(config)
         logger.debug(f"Loaded configuration from {config}")
@@ -114,6 +124,12 @@ def estimate(
 
     BOM_FILE: Path to the Bill of Materials file (CSV, Excel, etc.)
     """
+    # Imported here so --help and validate-config do not load pandas or the LLM SDKs
+    from pcb_cost_estimator.bom_parser import BomParser
+    from pcb_cost_estimator.cost_estimator import CostEstimator
+    from pcb_cost_estimator.llm_enrichment import create_enrichment_service
+    from pcb_cost_estimator.reporting import generate_report
+
     logger = logging.getLogger(__name__)
     config_dict = ctx.obj.get("config", {})
 
@@ -184,14 +200,8 @@ def estimate(
         # Auto-detect format from output file extension if output specified
         report_format = format
         if output:
-            ext = output.suffix.lower()
-            if ext == '.json':
-                report_format = 'json'
-            elif ext == '.csv':
-                report_format = 'csv'
-            elif ext in ['.md', '.markdown']:
-                report_format = 'markdown'
-            # Otherwise use the specified format
+            # Unrecognised extensions keep the --format choice
+            report_format = REPORT_FORMATS_BY_EXTENSION.get(output.suffix.lower(), format)
 
         # Generate report in the specified format
         if report_format == 'table':
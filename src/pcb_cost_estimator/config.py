@@ -1,19 +1,61 @@
 """Configuration management for PCB Cost Estimator."""
 
 import logging
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import ModuleType
+from typing import Any, Dict, Optional, Tuple
 
-import yaml
-from pydantic import BaseModel, Field, validator, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 logger = logging.getLogger(__name__)
 
+# Bound by _yaml(); module __getattr__ resolves it on first access
+LIBYAML_AVAILABLE: bool
+
+
+@lru_cache(maxsize=None)
+def _yaml() -> Tuple[ModuleType, type, type]:
+    """Import PyYAML on first use, preferring the LibYAML loader and dumper.
+
+    Also sets ``LIBYAML_AVAILABLE``.
+
+    Returns:
+        Tuple of (yaml module, loader class, dumper class)
+    """
+    global LIBYAML_AVAILABLE
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+        LIBYAML_AVAILABLE = True
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+        LIBYAML_AVAILABLE = False
+        logger.debug("PyYAML built without LibYAML, using the pure-Python loader")
+    return yaml, YamlLoader, YamlDumper
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``LIBYAML_AVAILABLE`` by importing PyYAML on first access."""
+    if name == "LIBYAML_AVAILABLE":
+        _yaml()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Project root of a source checkout (src/pcb_cost_estimator/config.py), resolved once
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+COST_MODEL_FILE = Path("config") / "cost_model.yaml"
+
 
 class APIConfig(BaseModel):
     """API configuration settings (legacy - kept for backward compatibility)."""
 
+    model_config = ConfigDict(defer_build=True)
+
     provider: str = Field(
         default="openai",
         description="AI provider: 'openai' or 'anthropic'",
@@ -38,10 +80,11 @@ class APIConfig(BaseModel):
         description="Maximum tokens for AI model responses",
     )
 
-    @validator("provider")
+    @field_validator("provider")
+    @classmethod
     def validate_provider(cls, v: str) -> str:
         """Validate API provider."""
-        if v.lower() not in ["openai", "anthropic"]:
+        if v.lower() not in {"openai", "anthropic"}:
             raise ValueError("Provider must be 'openai' or 'anthropic'")
         return v.lower()
 
@@ -49,6 +92,8 @@ class APIConfig(BaseModel):
 class LLMEnrichmentConfig(BaseModel):
     """LLM enrichment configuration for component analysis."""
 
+    model_config = ConfigDict(defer_build=True)
+
     enabled: bool = Field(
         default=False,
         description="Enable LLM-powered enrichment features"
@@ -108,10 +153,11 @@ class LLMEnrichmentConfig(BaseModel):
         description="Enable LLM obsolescence risk detection"
     )
 
-    @validator("provider")
+    @field_validator("provider")
+    @classmethod
     def validate_provider(cls, v: str) -> str:
         """Validate LLM provider."""
-        if v.lower() not in ["openai", "anthropic"]:
+        if v.lower() not in {"openai", "anthropic"}:
             raise ValueError("Provider must be 'openai' or 'anthropic'")
         return v.lower()
 
@@ -119,6 +165,8 @@ class LLMEnrichmentConfig(BaseModel):
 class PricingConfig(BaseModel):
     """Pricing configuration settings."""
 
+    model_config = ConfigDict(defer_build=True)
+
     markup_percentage: float = Field(
         default=20.0,
         ge=0.0,
@@ -139,6 +187,8 @@ class PricingConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Logging configuration settings."""
 
+    model_config = ConfigDict(defer_build=True)
+
     level: str = Field(
         default="INFO",
         description="Logging level",
@@ -156,7 +206,8 @@ class LoggingConfig(BaseModel):
         description="Enable console output",
     )
 
-    @validator("level")
+    @field_validator("level")
+    @classmethod
     def validate_level(cls, v: str) -> str:
         """Validate logging level."""
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -168,6 +219,8 @@ class LoggingConfig(BaseModel):
 class CategoryPricing(BaseModel):
     """Pricing configuration for a component category."""
 
+    model_config = ConfigDict(defer_build=True)
+
     base_price_low: float = Field(..., description="Low estimate of base price", ge=0.0)
     base_price_typical: float = Field(..., description="Typical base price", ge=0.0)
     base_price_high: float = Field(..., description="High estimate of base price", ge=0.0)
@@ -176,6 +229,8 @@ class CategoryPricing(BaseModel):
 class PackagePricing(BaseModel):
     """Pricing adjustments for package types."""
 
+    model_config = ConfigDict(defer_build=True)
+
     multiplier: float = Field(
         default=1.0,
         description="Price multiplier for this package type",
@@ -187,6 +242,8 @@ class PackagePricing(BaseModel):
 class AssemblyPricing(BaseModel):
     """Assembly cost configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     setup_cost: float = Field(
         default=100.0,
         description="One-time assembly setup cost",
@@ -247,6 +304,8 @@ class AssemblyPricing(BaseModel):
 class QuantityBreakConfig(BaseModel):
     """Quantity break pricing configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     tiers: list[int] = Field(
         default=[1, 10, 100, 1000, 10000],
         description="Quantity tiers for price breaks"
@@ -260,15 +319,16 @@ class QuantityBreakConfig(BaseModel):
     @classmethod
     def validate_discount_curve(cls, v: list[float]) -> list[float]:
         """Validate discount curve is monotonically decreasing."""
-        for i in range(len(v) - 1):
-            if v[i] < v[i + 1]:
-                raise ValueError("Discount curve must be monotonically decreasing")
+        if any(a < b for a, b in zip(v, v[1:])):
+            raise ValueError("Discount curve must be monotonically decreasing")
         return v
 
 
 class OverheadConfig(BaseModel):
     """Overhead and markup configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     nre_cost: float = Field(
         default=500.0,
         description="Non-recurring engineering cost",
@@ -303,6 +363,8 @@ class OverheadConfig(BaseModel):
 class CostModelConfig(BaseModel):
     """Cost model configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     # Category-based pricing
     category_pricing: Dict[str, CategoryPricing] = Field(
         default_factory=dict,
@@ -337,6 +399,8 @@ class CostModelConfig(BaseModel):
 class Config(BaseModel):
     """Main configuration model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     api: APIConfig = Field(default_factory=APIConfig)
     pricing: PricingConfig = Field(default_factory=PricingConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
@@ -350,6 +414,9 @@ class Config(BaseModel):
 def load_config(config_path: Path) -> Dict[str, Any]:
     """Load configuration from YAML file.
 
+    Parsed configurations are cached per file and reused until the file's
+    modification time or size changes.
+
     Args:
         config_path: Path to configuration file
 
@@ -360,18 +427,34 @@ def load_config(config_path: Path) -> Dict[str, Any]:
         FileNotFoundError: If config file doesn't exist
         yaml.YAMLError: If config file is invalid YAML
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        file_stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    config = _load_config_model(
+        str(config_path.absolute()), file_stat.st_mtime_ns, file_stat.st_size
+    )
+
+    # Dumping the cached model gives each caller its own dict, and is much
+    # cheaper than deep-copying a cached dict
+    return config.model_dump()
+
+
+@lru_cache(maxsize=16)
+def _load_config_model(config_path: str, mtime_ns: int, size: int) -> Config:
+    """Parse and validate a configuration file.
 
+    The modification time and size are only part of the cache key.
+    """
     logger.debug(f"Loading configuration from {config_path}")
 
-    with open(config_path, "r") as f:
-        config_data = yaml.safe_load(f)
+    with open(config_path, "rb") as f:
+        yaml, loader, _ = _yaml()
+        config_data = yaml.load(f, Loader=loader)
 
     # Validate configuration using Pydantic model
-    config = Config(**config_data)
-
-    return config.model_dump()
+    return Config(**config_data)
 
 
 def save_config(config_data: Dict[str, Any], config_path: Path) -> None:
@@ -389,7 +472,72 @@ def save_config(config_data: Dict[str, Any], config_path: Path) -> None:
 
     logger.debug(f"Saving configuration to {config_path}")
 
+    yaml, _, dumper = _yaml()
     with open(config_path, "w") as f:
-        yaml.dump(config.model_dump(), f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config.model_dump(), f, Dumper=dumper, default_flow_style=False, sort_keys=False
+        )
+
+    # A rewrite within the filesystem's mtime resolution that keeps the same
+    # size would otherwise still hit the old cache entry
+    _load_config_model.cache_clear()
 
     logger.info(f"Configuration saved to {config_path}")
+
+
+def load_cost_model_config(config_path: Optional[Path] = None) -> CostModelConfig:
+    """Load the cost model configuration.
+
+    Uses the first file found among ``config_path``, ``config/cost_model.yaml``
+    in the working directory and ``config/cost_model.yaml`` in the project root,
+    falling back to the CostModelConfig defaults. Parsed files are cached per
+    file like ``load_config``, and the defaults are only built once.
+
+    Args:
+        config_path: Optional path to a cost model YAML file
+
+    Returns:
+        Validated cost model configuration
+    """
+    search_paths = (COST_MODEL_FILE, _PROJECT_ROOT / COST_MODEL_FILE)
+    if config_path is not None:
+        search_paths = (Path(config_path),) + search_paths
+
+    # One stat per candidate: it both finds the file and keys the cache
+    for path in search_paths:
+        try:
+            file_stat = path.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(file_stat.st_mode):
+            cost_model = _load_cost_model(
+                str(path.absolute()), file_stat.st_mtime_ns, file_stat.st_size
+            )
+            break
+    else:
+        logger.debug("No cost model file found, using default cost model")
+        cost_model = _default_cost_model()
+
+    # Callers own the returned model, so never hand out the cached one
+    return cost_model.model_copy(deep=True)
+
+
+@lru_cache(maxsize=16)
+def _load_cost_model(config_path: str, mtime_ns: int, size: int) -> CostModelConfig:
+    """Parse and validate a cost model file.
+
+    The modification time and size are only part of the cache key.
+    """
+    logger.debug(f"Loading cost model from {config_path}")
+
+    with open(config_path, "rb") as f:
+        yaml, loader, _ = _yaml()
+        data = yaml.load(f, Loader=loader) or {}
+
+    return CostModelConfig(**data)
+
+
+@lru_cache(maxsize=None)
+def _default_cost_model() -> CostModelConfig:
+    """Build the default cost model once."""
+    return CostModelConfig()
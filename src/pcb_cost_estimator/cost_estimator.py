@@ -2,7 +2,9 @@
 
 import re
 import logging
-from typing import Optional, List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Iterable, Optional, List, Dict, NamedTuple, Tuple
 from datetime import datetime
 
 from .models import (
@@ -17,19 +19,38 @@ from .models import (
     CostEstimate,
 )
 from .config import CostModelConfig, CategoryPricing, PackagePricing
+from .keyword_scanner import KeywordScanner
 
 
 logger = logging.getLogger(__name__)
 
 # Optional LLM enrichment import
 try:
-    from .llm_enrichment import LLMEnrichmentService
+    from .llm_enrichment import LLMEnrichmentService, PriceReasonablenessResult
     LLM_ENRICHMENT_AVAILABLE = True
 except ImportError:
     LLM_ENRICHMENT_AVAILABLE = False
     logger.debug("LLM enrichment not available")
 
 
+def _compile_patterns(patterns_by_key: Dict, flags: int = 0) -> re.Pattern:
+    """Combine per-key pattern lists into one regex with a named group per key.
+
+    Alternatives are tried in dict order, so the first key with a matching
+    pattern wins, exactly as when matching the patterns one by one. The
+    winning key's name is available as ``match.lastgroup``.
+    """
+    return re.compile(
+        "|".join(
+            f"(?P<{key.name}>{'|'.join(patterns)})" for key, patterns in patterns_by_key.items()
+        ),
+        flags,
+    )
+
+
+_REF_DES_PREFIX_RE = re.compile(r"^([A-Z]+)")
+
+
 class ComponentClassifier:
     """Classifies components based on MPN patterns and descriptions."""
 
@@ -40,7 +61,7 @@ class ComponentClassifier:
             r"^ERJ-\d+",  # Panasonic ERJ series
             r"^CRCW\d+",  # Vishay CRCW series
             r"^RK73[HGB]",  # KOA Speer RK73 series
-            r"^\d+[kKmM]?\d*R?$",  # Common value patterns: 10k, 100R, 1M
+            r"^\d+[KM]?\d*R?$",  # Common value patterns: 10k, 100R, 1M
         ],
         ComponentCategory.CAPACITOR: [
             r"^C\d{4}",  # C0603, C0805, etc.
@@ -48,13 +69,13 @@ class ComponentClassifier:
             r"^CL\d+",  # Samsung CL series
             r"^CC\d+",  # Yageo CC series
             r"^GCM\d+",  # Murata GCM series
-            r"^\d+[pnuμ]?F",  # Common capacitor values: 100nF, 10uF, 22pF
+            r"^\d+[PNUΜ]?F",  # Common capacitor values: 100nF, 10uF, 22pF
         ],
         ComponentCategory.INDUCTOR: [
             r"^LQH\d+",  # Murata LQH series
             r"^MLZ\d+",  # TDK MLZ series
             r"^CDRH\d+",  # Sumida CDRH series
-            r"^\d+[unm]?H",  # Common inductor values: 10uH, 100nH
+            r"^\d+[UNM]?H",  # Common inductor values: 10uH, 100nH
         ],
         ComponentCategory.IC: [
             r"^LM\d+",  # LM series (linear regulators, op-amps, etc.)
@@ -112,6 +133,8 @@ class ComponentClassifier:
             r"^XFMR",  # Transformer prefix
         ],
     }
+    # Patterns are written in upper case to match the upper-cased MPN
+    _MPN_RE = _compile_patterns(MPN_PATTERNS)
 
     # Description keywords for component categories
     DESCRIPTION_KEYWORDS = {
@@ -133,6 +156,43 @@ class ComponentClassifier:
         ComponentCategory.FUSE: ["fuse"],
         ComponentCategory.TRANSFORMER: ["transformer", "xfmr"],
     }
+    _DESCRIPTION_SCANNER = KeywordScanner(
+        (keyword.lower(), category)
+        for category, keywords in DESCRIPTION_KEYWORDS.items()
+        for keyword in keywords
+    )
+
+    # Reference designator prefixes for component categories
+    REF_DES_PREFIXES = {
+        "R": ComponentCategory.RESISTOR,
+        "C": ComponentCategory.CAPACITOR,
+        "L": ComponentCategory.INDUCTOR,
+        "U": ComponentCategory.IC,
+        "IC": ComponentCategory.IC,
+        "D": ComponentCategory.DIODE,
+        "Q": ComponentCategory.TRANSISTOR,
+        "LED": ComponentCategory.LED,
+        "Y": ComponentCategory.CRYSTAL,
+        "X": ComponentCategory.CRYSTAL,
+        "XTAL": ComponentCategory.CRYSTAL,
+        "J": ComponentCategory.CONNECTOR,
+        "P": ComponentCategory.CONNECTOR,
+        "CON": ComponentCategory.CONNECTOR,
+        "SW": ComponentCategory.SWITCH,
+        "S": ComponentCategory.SWITCH,
+        "K": ComponentCategory.RELAY,
+        "RLY": ComponentCategory.RELAY,
+        "F": ComponentCategory.FUSE,
+        "T": ComponentCategory.TRANSFORMER,
+    }
+
+    def __init__(self) -> None:
+        # BoMs repeat the same parts across many lines. Caching per instance
+        # keeps any subclass overrides of the rule methods in effect. The cache
+        # holds the bound method, so it references this instance back and a
+        # classifier is only freed by the cyclic garbage collector; keys are
+        # just (MPN, description, prefix) strings, and the cache is kept small.
+        self._classify_by_rules = lru_cache(maxsize=512)(self._classify_by_rules)
 
     def classify_component(
         self,
@@ -152,22 +212,16 @@ class ComponentClassifier:
         if item.category != ComponentCategory.UNKNOWN:
             return item.category, None
 
-        # Try MPN pattern matching
-        if item.manufacturer_part_number:
-            category = self._classify_by_mpn(item.manufacturer_part_number)
-            if category != ComponentCategory.UNKNOWN:
-                logger.debug(f"Classified {item.reference_designator} as {category} by MPN")
-                return category, None
-
-        # Try description keyword matching
-        if item.description:
-            category = self._classify_by_description(item.description)
-            if category != ComponentCategory.UNKNOWN:
-                logger.debug(f"Classified {item.reference_designator} as {category} by description")
-                return category, None
-
-        # Try reference designator prefix as fallback
-        category = self._classify_by_ref_des(item.reference_designator)
+        # Rule-based classification by MPN, description, then reference designator
+        prefix_match = _REF_DES_PREFIX_RE.match(item.reference_designator.upper())
+        category, method = self._classify_by_rules(
+            item.manufacturer_part_number or "",
+            item.description or "",
+            prefix_match.group(1) if prefix_match else "",
+        )
+        if method:
+            logger.debug(f"Classified {item.reference_designator} as {category} by {method}")
+            return category, None
 
         # If still UNKNOWN and LLM enrichment is available, try LLM classification
         if category == ComponentCategory.UNKNOWN and llm_enrichment:
@@ -192,6 +246,32 @@ class ComponentClassifier:
         logger.debug(f"Classified {item.reference_designator} as {category} by reference designator")
         return category, None
 
+    def _classify_by_rules(
+        self, mpn: str, description: str, ref_des_prefix: str
+    ) -> Tuple[ComponentCategory, Optional[str]]:
+        """Classify by MPN pattern, then description keyword, then ref des prefix.
+
+        Args:
+            mpn: Manufacturer part number, or empty string
+            description: Component description, or empty string
+            ref_des_prefix: Leading letters of the reference designator
+
+        Returns:
+            Tuple of (ComponentCategory, "MPN" or "description" when matched by
+            those rules, otherwise None)
+        """
+        if mpn:
+            category = self._classify_by_mpn(mpn)
+            if category != ComponentCategory.UNKNOWN:
+                return category, "MPN"
+
+        if description:
+            category = self._classify_by_description(description)
+            if category != ComponentCategory.UNKNOWN:
+                return category, "description"
+
+        return self._classify_by_ref_des(ref_des_prefix), None
+
     def _classify_by_mpn(self, mpn: str) -> ComponentCategory:
         """Classify by manufacturer part number pattern matching.
 
@@ -201,12 +281,9 @@ class ComponentClassifier:
         Returns:
             ComponentCategory or UNKNOWN if no match
         """
-        mpn_upper = mpn.upper().strip()
-
-        for category, patterns in self.MPN_PATTERNS.items():
-            for pattern in patterns:
-                if re.match(pattern, mpn_upper, re.IGNORECASE):
-                    return category
+        match = self._MPN_RE.match(mpn.upper().strip())
+        if match:
+            return ComponentCategory[match.lastgroup]
 
         return ComponentCategory.UNKNOWN
 
@@ -221,12 +298,7 @@ class ComponentClassifier:
         """
         desc_lower = description.lower().strip()
 
-        for category, keywords in self.DESCRIPTION_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in desc_lower:
-                    return category
-
-        return ComponentCategory.UNKNOWN
+        return self._DESCRIPTION_SCANNER.find(desc_lower) or ComponentCategory.UNKNOWN
 
     def _classify_by_ref_des(self, ref_des: str) -> ComponentCategory:
         """Classify by reference designator prefix.
@@ -238,37 +310,13 @@ class ComponentClassifier:
             ComponentCategory or UNKNOWN if no match
         """
         # Extract prefix letters from reference designator
-        prefix_match = re.match(r"^([A-Z]+)", ref_des.upper())
+        prefix_match = _REF_DES_PREFIX_RE.match(ref_des.upper())
         if not prefix_match:
             return ComponentCategory.UNKNOWN
 
         prefix = prefix_match.group(1)
 
-        # Map common prefixes to categories
-        prefix_map = {
-            "R": ComponentCategory.RESISTOR,
-            "C": ComponentCategory.CAPACITOR,
-            "L": ComponentCategory.INDUCTOR,
-            "U": ComponentCategory.IC,
-            "IC": ComponentCategory.IC,
-            "D": ComponentCategory.DIODE,
-            "Q": ComponentCategory.TRANSISTOR,
-            "LED": ComponentCategory.LED,
-            "Y": ComponentCategory.CRYSTAL,
-            "X": ComponentCategory.CRYSTAL,
-            "XTAL": ComponentCategory.CRYSTAL,
-            "J": ComponentCategory.CONNECTOR,
-            "P": ComponentCategory.CONNECTOR,
-            "CON": ComponentCategory.CONNECTOR,
-            "SW": ComponentCategory.SWITCH,
-            "S": ComponentCategory.SWITCH,
-            "K": ComponentCategory.RELAY,
-            "RLY": ComponentCategory.RELAY,
-            "F": ComponentCategory.FUSE,
-            "T": ComponentCategory.TRANSFORMER,
-        }
-
-        return prefix_map.get(prefix, ComponentCategory.UNKNOWN)
+        return self.REF_DES_PREFIXES.get(prefix, ComponentCategory.UNKNOWN)
 
 
 class PackageClassifier:
@@ -304,6 +352,13 @@ class PackageClassifier:
             r"^CONN", r"^HEADER", r"^SOCKET",
         ],
     }
+    _PACKAGE_RE = _compile_patterns(PACKAGE_PATTERNS)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Recompile the package regex for subclasses that override PACKAGE_PATTERNS."""
+        super().__init_subclass__(**kwargs)
+        if "PACKAGE_PATTERNS" in cls.__dict__:
+            cls._PACKAGE_RE = _compile_patterns(cls.PACKAGE_PATTERNS)
 
     def classify_package(self, item: BomItem) -> PackageType:
         """Classify package type for assembly cost estimation.
@@ -319,13 +374,9 @@ class PackageClassifier:
             # Guess based on category
             return self._guess_package_by_category(item.category)
 
-        package_upper = item.package.upper().strip()
-
-        # Try pattern matching
-        for pkg_type, patterns in self.PACKAGE_PATTERNS.items():
-            for pattern in patterns:
-                if re.match(pattern, package_upper):
-                    return pkg_type
+        pkg_type = _match_package(type(self), item.package.upper().strip())
+        if pkg_type != PackageType.UNKNOWN:
+            return pkg_type
 
         # Check for connector category
         if item.category == ComponentCategory.CONNECTOR:
@@ -360,24 +411,80 @@ class PackageClassifier:
         return category_defaults.get(category, PackageType.OTHER)
 
 
+@lru_cache(maxsize=1024)
+def _match_package(classifier: "type[PackageClassifier]", package: str) -> PackageType:
+    """Match a normalized package name against a PackageClassifier class's patterns.
+
+    BoMs repeat the same few package names across many lines, so results are
+    cached per name. The classifier class is part of the key, so subclasses
+    keep their own patterns.
+    """
+    match = classifier._PACKAGE_RE.match(package)
+    if match:
+        return PackageType[match.lastgroup]
+
+    return PackageType.UNKNOWN
+
+
+class PreparedBom(NamedTuple):
+    """Quantity-independent classification and pricing of a parsed BoM."""
+
+    bom_result: BomParseResult
+    component_costs: List[ComponentCostEstimate]
+    warnings: List[str]
+    notes: List[str]
+    total_component_cost_low: float
+    total_component_cost_typical: float
+    total_component_cost_high: float
+    assembly_cost: AssemblyCost
+
+
+class UnitPricing(NamedTuple):
+    """Package-adjusted unit costs for one category/package pair."""
+
+    low: float
+    typical: float
+    high: float
+    tier_prices: List[Tuple[int, float]]
+
+
 class CostEstimator:
     """Deterministic cost estimation engine."""
 
+    # Assembly pricing field holding the placement cost of each package type
+    PLACEMENT_COST_FIELDS = {
+        PackageType.SMD_SMALL: "cost_per_smd_small",
+        PackageType.SMD_MEDIUM: "cost_per_smd_medium",
+        PackageType.SMD_LARGE: "cost_per_smd_large",
+        PackageType.SOIC: "cost_per_soic",
+        PackageType.QFP: "cost_per_qfp",
+        PackageType.QFN: "cost_per_qfn",
+        PackageType.BGA: "cost_per_bga",
+        PackageType.THROUGH_HOLE: "cost_per_through_hole",
+        PackageType.CONNECTOR: "cost_per_connector",
+        PackageType.OTHER: "cost_per_other",
+    }
+
     def __init__(
         self,
         config: CostModelConfig,
-        llm_enrichment: Optional['LLMEnrichmentService'] = None
+        llm_enrichment: Optional['LLMEnrichmentService'] = None,
+        max_workers: Optional[int] = None
     ):
         """Initialize cost estimator with configuration.
 
         Args:
             config: Cost model configuration
             llm_enrichment: Optional LLM enrichment service for enhanced analysis
+            max_workers: Maximum concurrent component estimates while LLM
+                         enrichment is enabled (default: ThreadPoolExecutor's
+                         default; 1 estimates sequentially)
         """
         self.config = config
         self.component_classifier = ComponentClassifier()
         self.package_classifier = PackageClassifier()
         self.llm_enrichment = llm_enrichment
+        self.max_workers = max_workers
 
     def estimate_bom_cost(
         self,
@@ -393,70 +500,53 @@ class CostEstimator:
         Returns:
             Complete cost estimate with itemized breakdown
         """
-        logger.info(f"Estimating cost for {len(bom_result.items)} components, {board_quantity} boards")
-
-        # Filter out DNP items
-        active_items = [item for item in bom_result.items if not item.dnp]
-        logger.info(f"Active components (excluding DNP): {len(active_items)}")
+        return self.apply(self.prepare(bom_result), board_quantity)
 
-        # Estimate individual component costs
-        component_costs: List[ComponentCostEstimate] = []
-        warnings: List[str] = []
+    def prepare(self, bom_result: BomParseResult) -> PreparedBom:
+        """Classify and price every active BoM item.
 
-        for item in active_items:
-            try:
-                cost_estimate, item_warnings = self._estimate_component_cost(item, board_quantity)
-                component_costs.append(cost_estimate)
-                warnings.extend(item_warnings)
-            except Exception as e:
-                logger.error(f"Error estimating cost for {item.reference_designator}: {e}")
-                warnings.append(f"Could not estimate cost for {item.reference_designator}: {str(e)}")
+        This is the quantity-independent part of ``estimate_bom_cost``: component
+        classification, unit pricing, price breaks (computed for every tier),
+        obsolescence checks and the component and assembly totals. Reuse the
+        result with ``apply`` to estimate several board quantities without
+        repeating it.
 
-        # Calculate total component costs
-        total_component_cost_low = sum(c.total_cost_low for c in component_costs)
-        total_component_cost_typical = sum(c.total_cost_typical for c in component_costs)
-        total_component_cost_high = sum(c.total_cost_high for c in component_costs)
+        Args:
+            bom_result: Parsed BoM result
 
-        # Calculate assembly costs
-        assembly_cost = self._calculate_assembly_cost(component_costs)
+        Returns:
+            PreparedBom holding the component estimates, warnings and notes
+        """
+        logger.info(f"Estimating cost for {len(bom_result.items)} components")
 
-        # Calculate overhead costs
-        overhead_costs = self._calculate_overhead_costs(
-            total_component_cost_typical,
-            assembly_cost.total_assembly_cost_per_board,
-        )
+        # Filter out DNP items
+        active_items = [item for item in bom_result.items if not item.dnp]
+        logger.info(f"Active components (excluding DNP): {len(active_items)}")
 
-        # Calculate total costs per board
-        total_cost_per_board_low = (
-            total_component_cost_low +
-            assembly_cost.total_assembly_cost_per_board +
-            overhead_costs.total_overhead
-        )
-        total_cost_per_board_typical = (
-            total_component_cost_typical +
-            assembly_cost.total_assembly_cost_per_board +
-            overhead_costs.total_overhead
-        )
-        total_cost_per_board_high = (
-            total_component_cost_high +
-            assembly_cost.total_assembly_cost_per_board +
-            overhead_costs.total_overhead
-        )
+        # Estimate individual component costs
+        component_costs, warnings = self._estimate_component_costs(active_items)
 
-        # Check for obsolescence risks (if LLM enrichment enabled)
+        # Check for obsolescence risks (if LLM enrichment enabled). A disabled
+        # service answers every check with None, so skip re-classifying the BoM
         obsolescence_notes = []
-        if self.llm_enrichment:
-            components_to_check = [
-                {
-                    "mpn": item.manufacturer_part_number or "",
-                    "manufacturer": item.manufacturer or "",
-                    "description": item.description or "",
-                    "category": self.component_classifier.classify_component(item, None)[0].value,
-                    "quantity": item.quantity
-                }
-                for item in active_items
-                if item.manufacturer_part_number  # Only check components with MPN
-            ]
+        if self.llm_enrichment and self.llm_enrichment.enabled:
+            # Check each part once, however many lines it appears on. The key
+            # matches what the enrichment service caches obsolescence checks by
+            unique_components: Dict[Tuple[str, str, str], Dict] = {}
+            for item in active_items:
+                if not item.manufacturer_part_number:  # Only check components with MPN
+                    continue
+                category = self.component_classifier.classify_component(item, None)[0].value
+                key = (item.manufacturer_part_number, item.manufacturer or "", category)
+                if key not in unique_components:
+                    unique_components[key] = {
+                        "mpn": item.manufacturer_part_number,
+                        "manufacturer": item.manufacturer or "",
+                        "description": item.description or "",
+                        "category": category,
+                        "quantity": item.quantity
+                    }
+            components_to_check = list(unique_components.values())
 
             if components_to_check:
                 logger.info(f"Checking obsolescence for {len(components_to_check)} components")
@@ -465,7 +555,7 @@ class CostEstimator:
                 )
 
                 for result in obsolescence_results:
-                    if result.obsolescence_risk in ["high", "obsolete"]:
+                    if result.obsolescence_risk in {"high", "obsolete"}:
                         warning_msg = (
                             f"Obsolescence risk for {result.mpn}: {result.obsolescence_risk.upper()} "
                             f"(lifecycle: {result.lifecycle_status})"
@@ -484,12 +574,75 @@ class CostEstimator:
                             f"{result.mpn}: Medium obsolescence risk - monitor availability"
                         )
 
+        # Totals only depend on the components, so sum them once here rather
+        # than walking every estimate again for each board quantity
+        total_low = total_typical = total_high = 0.0
+        for cost in component_costs:
+            total_low += cost.total_cost_low
+            total_typical += cost.total_cost_typical
+            total_high += cost.total_cost_high
+
+        return PreparedBom(
+            bom_result=bom_result,
+            component_costs=component_costs,
+            warnings=warnings,
+            notes=obsolescence_notes,
+            total_component_cost_low=total_low,
+            total_component_cost_typical=total_typical,
+            total_component_cost_high=total_high,
+            assembly_cost=self._calculate_assembly_cost(component_costs),
+        )
+
+    def apply(self, prepared: PreparedBom, board_quantity: int = 1) -> CostEstimate:
+        """Build the cost estimate for a board quantity from a prepared BoM.
+
+        Args:
+            prepared: Result of ``prepare``
+            board_quantity: Number of boards to manufacture
+
+        Returns:
+            Complete cost estimate with itemized breakdown
+        """
+        logger.info(f"Building cost estimate for {board_quantity} boards")
+
+        # Each estimate gets its own copies so callers can modify them independently
+        component_costs = [comp.model_copy(deep=True) for comp in prepared.component_costs]
+
+        total_component_cost_low = prepared.total_component_cost_low
+        total_component_cost_typical = prepared.total_component_cost_typical
+        total_component_cost_high = prepared.total_component_cost_high
+
+        assembly_cost = prepared.assembly_cost.model_copy()
+
+        # Calculate overhead costs
+        overhead_costs = self._calculate_overhead_costs(
+            total_component_cost_typical,
+            assembly_cost.total_assembly_cost_per_board,
+        )
+
+        # Calculate total costs per board
+        total_cost_per_board_low = (
+            total_component_cost_low +
+            assembly_cost.total_assembly_cost_per_board +
+            overhead_costs.total_overhead
+        )
+        total_cost_per_board_typical = (
+            total_component_cost_typical +
+            assembly_cost.total_assembly_cost_per_board +
+            overhead_costs.total_overhead
+        )
+        total_cost_per_board_high = (
+            total_component_cost_high +
+            assembly_cost.total_assembly_cost_per_board +
+            overhead_costs.total_overhead
+        )
+
         # Combine warnings and notes
-        all_warnings = list(bom_result.warnings) + warnings
-        all_notes = obsolescence_notes
+        all_warnings = list(prepared.bom_result.warnings) + prepared.warnings
+        all_notes = list(prepared.notes)
 
         return CostEstimate(
-            file_path=bom_result.file_path,
+            file_path=prepared.bom_result.file_path,
             timestamp=datetime.now().isoformat(),
             currency="USD",
             component_costs=component_costs,
@@ -505,16 +658,76 @@ class CostEstimator:
             notes=all_notes,
         )
 
+    def _estimate_component_costs(
+        self,
+        items: List[BomItem],
+    ) -> Tuple[List[ComponentCostEstimate], List[str]]:
+        """Estimate costs for a batch of components.
+
+        Unit pricing depends only on the category and package type, so it is
+        computed once per pair and shared across the batch. LLM price checks are
+        likewise made once per distinct part and quantity.
+
+        With LLM enrichment enabled, estimates wait on API calls, so they run
+        on a thread pool. Lines sharing an MPN stay on one thread, which keeps
+        each part's price check to a single call.
+
+        Args:
+            items: Active BomItems to estimate
+
+        Returns:
+            Tuple of (ComponentCostEstimates, list of warnings), in item order
+        """
+        unit_pricing: Dict[Tuple[ComponentCategory, PackageType], UnitPricing] = {}
+        price_checks: Dict[Tuple, Optional['PriceReasonablenessResult']] = {}
+        results: List[Tuple[Optional[ComponentCostEstimate], List[str]]] = [(None, [])] * len(items)
+
+        def estimate(indices: Iterable[int]) -> None:
+            for index in indices:
+                item = items[index]
+                try:
+                    results[index] = self._estimate_component_cost(
+                        item, board_quantity=1, unit_pricing=unit_pricing, price_checks=price_checks
+                    )
+                except Exception as e:
+                    logger.error(f"Error estimating cost for {item.reference_designator}: {e}")
+                    results[index] = None, [
+                        f"Could not estimate cost for {item.reference_designator}: {str(e)}"
+                    ]
+
+        llm_enabled = self.llm_enrichment is not None and self.llm_enrichment.enabled
+        if not llm_enabled or self.max_workers == 1 or len(items) <= 1:
+            estimate(range(len(items)))
+        else:
+            groups: Dict[Any, List[int]] = {}
+            for index, item in enumerate(items):
+                groups.setdefault(item.manufacturer_part_number or index, []).append(index)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(estimate, groups.values()))
+
+        component_costs: List[ComponentCostEstimate] = []
+        warnings: List[str] = []
+        for cost_estimate, item_warnings in results:
+            if cost_estimate is not None:
+                component_costs.append(cost_estimate)
+            warnings.extend(item_warnings)
+
+        return component_costs, warnings
+
     def _estimate_component_cost(
         self,
         item: BomItem,
         board_quantity: int,
+        unit_pricing: Optional[Dict[Tuple[ComponentCategory, PackageType], UnitPricing]] = None,
+        price_checks: Optional[Dict[Tuple, Optional['PriceReasonablenessResult']]] = None,
     ) -> Tuple[ComponentCostEstimate, List[str]]:
         """Estimate cost for a single component.
 
         Args:
             item: BomItem to estimate
             board_quantity: Number of boards
+            unit_pricing: Optional cache of unit pricing by (category, package type)
+            price_checks: Optional cache of LLM price check results by part
 
         Returns:
             Tuple of (ComponentCostEstimate with price breaks, list of warnings)
@@ -527,16 +740,14 @@ class CostEstimator:
         )
         package_type = self.package_classifier.classify_package(item)
 
-        # Get base pricing for category
-        base_pricing = self._get_category_pricing(category)
-
-        # Get package multiplier
-        package_multiplier = self._get_package_multiplier(package_type)
-
-        # Calculate unit costs with package multiplier
-        unit_cost_low = base_pricing.base_price_low * package_multiplier
-        unit_cost_typical = base_pricing.base_price_typical * package_multiplier
-        unit_cost_high = base_pricing.base_price_high * package_multiplier
+        # Get unit costs and per-tier unit prices for the category/package pair
+        pricing_key = (category, package_type)
+        pricing = unit_pricing.get(pricing_key) if unit_pricing is not None else None
+        if pricing is None:
+            pricing = self._get_unit_pricing(category, package_type)
+            if unit_pricing is not None:
+                unit_pricing[pricing_key] = pricing
+        unit_cost_low, unit_cost_typical, unit_cost_high, tier_prices = pricing
 
         # Calculate total costs (per board)
         total_cost_low = unit_cost_low * item.quantity
@@ -544,14 +755,17 @@ class CostEstimator:
         total_cost_high = unit_cost_high * item.quantity
 
         # Calculate quantity break pricing
-        price_breaks = self._calculate_price_breaks(
-            unit_cost_typical,
-            item.quantity,
-            board_quantity,
-        )
+        price_breaks = [
+            PriceBreak(
+                quantity=tier_qty,
+                unit_price=tier_unit_price,
+                total_price=tier_unit_price * (item.quantity * tier_qty),
+            )
+            for tier_qty, tier_unit_price in tier_prices
+        ]
 
         # Build notes list
-        notes = list(item.notes) if item.notes else []
+        notes = [item.notes] if item.notes else []
         if llm_metadata:
             notes.append(
                 f"LLM classification (confidence: {llm_metadata['confidence']:.2f})"
@@ -559,16 +773,29 @@ class CostEstimator:
 
         # LLM price reasonableness check (if enabled)
         if self.llm_enrichment and item.manufacturer_part_number:
-            price_check = self.llm_enrichment.check_price_reasonableness(
-                mpn=item.manufacturer_part_number,
-                description=item.description or "",
-                category=category.value,
-                package_type=package_type.value,
-                unit_cost_low=unit_cost_low,
-                unit_cost_typical=unit_cost_typical,
-                unit_cost_high=unit_cost_high,
-                quantity=item.quantity
+            # Unit costs follow from the category and package type
+            check_key = (
+                item.manufacturer_part_number,
+                item.description or "",
+                category,
+                package_type,
+                item.quantity,
             )
+            if price_checks is not None and check_key in price_checks:
+                price_check = price_checks[check_key]
+            else:
+                price_check = self.llm_enrichment.check_price_reasonableness(
+                    mpn=item.manufacturer_part_number,
+                    description=item.description or "",
+                    category=category.value,
+                    package_type=package_type.value,
+                    unit_cost_low=unit_cost_low,
+                    unit_cost_typical=unit_cost_typical,
+                    unit_cost_high=unit_cost_high,
+                    quantity=item.quantity
+                )
+                if price_checks is not None:
+                    price_checks[check_key] = price_check
 
             if price_check and not price_check.is_reasonable:
                 warning_msg = (
@@ -599,11 +826,47 @@ class CostEstimator:
             manufacturer=item.manufacturer,
             manufacturer_part_number=item.manufacturer_part_number,
             description=item.description,
-            notes=notes,
+            notes="; ".join(notes) or None,
         )
 
         return estimate, warnings
 
+    def _get_unit_pricing(
+        self,
+        category: ComponentCategory,
+        package_type: PackageType,
+    ) -> UnitPricing:
+        """Get unit costs and per-tier unit prices for a category and package.
+
+        Args:
+            category: Component category
+            package_type: Package type
+
+        Returns:
+            UnitPricing with package-adjusted low/typical/high unit costs
+        """
+        # Get base pricing for category
+        base_pricing = self._get_category_pricing(category)
+
+        # Get package multiplier
+        package_multiplier = self._get_package_multiplier(package_type)
+
+        # Calculate unit costs with package multiplier
+        unit_cost_typical = base_pricing.base_price_typical * package_multiplier
+
+        return UnitPricing(
+            low=base_pricing.base_price_low * package_multiplier,
+            typical=unit_cost_typical,
+            high=base_pricing.base_price_high * package_multiplier,
+            tier_prices=[
+                (tier_qty, unit_cost_typical * discount)
+                for tier_qty, discount in zip(
+                    self.config.quantity_breaks.tiers,
+                    self.config.quantity_breaks.discount_curve,
+                )
+            ],
+        )
+
     def _get_category_pricing(self, category: ComponentCategory) -> CategoryPricing:
         """Get base pricing for a component category.
 
@@ -643,45 +906,6 @@ class CostEstimator:
         # Return default multiplier
         return 1.0
 
-    def _calculate_price_breaks(
-        self,
-        unit_price: float,
-        qty_per_board: int,
-        board_quantity: int,
-    ) -> List[PriceBreak]:
-        """Calculate quantity break pricing for component.
-
-        Args:
-            unit_price: Base unit price
-            qty_per_board: Quantity per board
-            board_quantity: Number of boards
-
-        Returns:
-            List of price breaks for quantity tiers
-        """
-        price_breaks: List[PriceBreak] = []
-
-        tiers = self.config.quantity_breaks.tiers
-        discounts = self.config.quantity_breaks.discount_curve
-
-        for tier_qty, discount in zip(tiers, discounts):
-            # Calculate total quantity needed
-            total_qty = qty_per_board * tier_qty
-
-            # Apply volume discount
-            tier_unit_price = unit_price * discount
-            tier_total_price = tier_unit_price * total_qty
-
-            price_breaks.append(
-                PriceBreak(
-                    quantity=tier_qty,
-                    unit_price=tier_unit_price,
-                    total_price=tier_total_price,
-                )
-            )
-
-        return price_breaks
-
     def _calculate_assembly_cost(
         self,
         component_costs: List[ComponentCostEstimate],
@@ -695,18 +919,7 @@ class CostEstimator:
             Assembly cost breakdown
         """
         # Count components by package type
-        package_counts = {
-            PackageType.SMD_SMALL: 0,
-            PackageType.SMD_MEDIUM: 0,
-            PackageType.SMD_LARGE: 0,
-            PackageType.SOIC: 0,
-            PackageType.QFP: 0,
-            PackageType.QFN: 0,
-            PackageType.BGA: 0,
-            PackageType.THROUGH_HOLE: 0,
-            PackageType.CONNECTOR: 0,
-            PackageType.OTHER: 0,
-        }
+        package_counts = dict.fromkeys(self.PLACEMENT_COST_FIELDS, 0)
 
         total_components = 0
         unique_components = len(component_costs)
@@ -719,17 +932,10 @@ class CostEstimator:
                 package_counts[cost.package_type] += quantity
 
         # Calculate placement costs
+        assembly = self.config.assembly
         placement_cost = 0.0
-        placement_cost += package_counts[PackageType.SMD_SMALL] * self.config.assembly.cost_per_smd_small
-        placement_cost += package_counts[PackageType.SMD_MEDIUM] * self.config.assembly.cost_per_smd_medium
-        placement_cost += package_counts[PackageType.SMD_LARGE] * self.config.assembly.cost_per_smd_large
-        placement_cost += package_counts[PackageType.SOIC] * self.config.assembly.cost_per_soic
-        placement_cost += package_counts[PackageType.QFP] * self.config.assembly.cost_per_qfp
-        placement_cost += package_counts[PackageType.QFN] * self.config.assembly.cost_per_qfn
-        placement_cost += package_counts[PackageType.BGA] * self.config.assembly.cost_per_bga
-        placement_cost += package_counts[PackageType.THROUGH_HOLE] * self.config.assembly.cost_per_through_hole
-        placement_cost += package_counts[PackageType.CONNECTOR] * self.config.assembly.cost_per_connector
-        placement_cost += package_counts[PackageType.OTHER] * self.config.assembly.cost_per_other
+        for package_type, cost_field in self.PLACEMENT_COST_FIELDS.items():
+            placement_cost += package_counts[package_type] * getattr(assembly, cost_field)
 
         # Setup cost is one-time
         setup_cost = self.config.assembly.setup_cost
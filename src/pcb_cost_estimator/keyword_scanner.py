@@ -0,0 +1,57 @@
+"""Multi-keyword substring scanning shared by the BoM parser and classifier."""
+
+from typing import Generic, Iterable, Optional, TypeVar
+
+# Optional Aho-Corasick automaton for keyword scans; falls back to substring checks
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+T = TypeVar("T")
+
+
+class KeywordScanner(Generic[T]):
+    """Multi-keyword substring scanner.
+
+    Keywords are given in priority order; ``find`` returns the value of the
+    highest-priority keyword that occurs anywhere in the text. With
+    pyahocorasick installed the text is scanned once, otherwise each keyword
+    is checked with ``in``.
+    """
+
+    def __init__(self, keywords: Iterable[tuple[str, T]]):
+        """Build the scanner.
+
+        Args:
+            keywords: (keyword, value) pairs in priority order. Keywords are
+                matched case-sensitively, so pass them lowercased and scan
+                lowercased text.
+        """
+        self._keywords: dict[str, tuple[int, T]] = {}
+        for keyword, value in keywords:
+            self._keywords.setdefault(keyword, (len(self._keywords), value))
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self._keywords:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, entry in self._keywords.items():
+                self._automaton.add_word(keyword, entry)
+            self._automaton.make_automaton()
+
+    def find(self, text: str) -> Optional[T]:
+        """Return the value of the highest-priority keyword found in text."""
+        if self._automaton is None:
+            for keyword, (_, value) in self._keywords.items():
+                if keyword in text:
+                    return value
+            return None
+
+        best: Optional[tuple[int, T]] = None
+        for _, entry in self._automaton.iter(text):
+            if best is None or entry[0] < best[0]:
+                best = entry
+                if best[0] == 0:
+                    break
+        return best[1] if best is not None else None
@@ -8,14 +8,47 @@ import hashlib
 import json
 import logging
 import sqlite3
+import sys
+import threading
 import time
+import weakref
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel
 
+# Optional faster JSON codec for stored responses; stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Memory-map up to this much of the database for reads; less on 32-bit builds,
+# where address space is scarce
+_MMAP_SIZE = 256 * 1024 * 1024 if sys.maxsize > 2**32 else 64 * 1024 * 1024
+
+# Write batched access times once this many cache hits are pending
+_ACCESS_FLUSH_THRESHOLD = 256
+
+
+@lru_cache(maxsize=8192)
+def _cache_key(prompt_type: str, mpn: str, additional_context: Optional[str]) -> str:
+    """Hash the key parts for a cache lookup.
+
+    Every enrichment check does a get and usually a set for the same MPN, and
+    large BoMs repeat MPNs, so digests are memoized per key.
+    """
+    key_components = [prompt_type, mpn.upper().strip()]
+    if additional_context:
+        key_components.append(additional_context)
+
+    key_string = "|".join(key_components)
+    return hashlib.sha256(key_string.encode()).hexdigest()
+
 
 class CacheEntry(BaseModel):
     """Cache entry metadata."""
@@ -46,14 +79,24 @@ class LLMCache:
 
         self.cache_file = Path(cache_file)
         self.ttl_seconds = ttl_seconds
+        # One connection shared by all calls (and threads), serialized by the lock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # Access times of cache hits not yet written, by cache key
+        self._pending_access: Dict[str, float] = {}
         self._init_database()
 
     def _init_database(self) -> None:
         """Initialize the SQLite database schema."""
         try:
-            with sqlite3.connect(self.cache_file) as conn:
+            with self._lock, self._connection() as conn:
                 cursor = conn.cursor()
 
+                # Write-ahead logging lets readers run alongside a writer and
+                # avoids a journal fsync per commit. The mode is stored in the
+                # database file, so it only needs setting once
+                cursor.execute("PRAGMA journal_mode=WAL")
+
                 # Create cache table
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS llm_cache (
@@ -90,6 +133,48 @@ class LLMCache:
         except Exception as e:
             logger.error(f"Failed to initialize cache database: {e}")
 
+    def _connection(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use.
+
+        Callers must hold ``self._lock``.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.cache_file, check_same_thread=False)
+            # With WAL, NORMAL only syncs at checkpoints and cannot corrupt the
+            # database; at worst the last few cached responses are lost on power loss
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-8000")
+            conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+            self._conn = conn
+            # Close when the cache is garbage collected or at interpreter exit
+            self._finalizer = weakref.finalize(self, conn.close)
+        return self._conn
+
+    def _flush_access_times(self, conn: sqlite3.Connection) -> None:
+        """Write pending access times; the caller commits. Callers must hold ``self._lock``."""
+        if self._pending_access:
+            conn.executemany(
+                "UPDATE llm_cache SET last_accessed_at = ? WHERE cache_key = ?",
+                [(accessed_at, key) for key, accessed_at in self._pending_access.items()],
+            )
+            self._pending_access.clear()
+
+    def close(self) -> None:
+        """Write pending access times and close the database connection.
+
+        Later calls reopen it.
+        """
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    with self._conn:
+                        self._flush_access_times(self._conn)
+                except sqlite3.Error as e:
+                    logger.error(f"Failed to write cache access times: {e}")
+                self._finalizer()
+                self._conn = None
+
     def _generate_cache_key(
         self,
         prompt_type: str,
@@ -107,12 +192,7 @@ class LLMCache:
         Returns:
             SHA256 hash as cache key
         """
-        key_components = [prompt_type, mpn.upper().strip()]
-        if additional_context:
-            key_components.append(additional_context)
-
-        key_string = "|".join(key_components)
-        return hashlib.sha256(key_string.encode()).hexdigest()
+        return _cache_key(prompt_type, mpn, additional_context)
 
     def get(
         self,
@@ -134,7 +214,7 @@ class LLMCache:
         cache_key = self._generate_cache_key(prompt_type, mpn, additional_context)
 
         try:
-            with sqlite3.connect(self.cache_file) as conn:
+            with self._lock, self._connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("""
@@ -163,15 +243,17 @@ class LLMCache:
                     conn.commit()
                     return None
 
-                # Update last accessed time
-                cursor.execute("""
-                    UPDATE llm_cache
-                    SET last_accessed_at = ?
-                    WHERE cache_key = ?
-                """, (time.time(), cache_key))
-                conn.commit()
+                # Access times are only bookkeeping, so they are batched into a
+                # later write instead of making every hit a write transaction
+                self._pending_access[cache_key] = time.time()
+                if len(self._pending_access) >= _ACCESS_FLUSH_THRESHOLD:
+                    self._flush_access_times(conn)
+                    conn.commit()
 
-                response_data = json.loads(response_data_json)
+                if ORJSON_AVAILABLE:
+                    response_data = orjson.loads(response_data_json)
+                else:
+                    response_data = json.loads(response_data_json)
                 logger.debug(f"Cache hit for {prompt_type}:{mpn}")
                 return response_data
 
@@ -203,11 +285,18 @@ class LLMCache:
         cache_key = self._generate_cache_key(prompt_type, mpn, additional_context)
 
         try:
-            with sqlite3.connect(self.cache_file) as conn:
+            with self._lock, self._connection() as conn:
                 cursor = conn.cursor()
 
+                # Piggyback pending access times on this write
+                self._flush_access_times(conn)
+
                 now = time.time()
-                response_data_json = json.dumps(response_data)
+                # Stored as TEXT either way, so both codecs read each other's entries
+                if ORJSON_AVAILABLE:
+                    response_data_json = orjson.dumps(response_data).decode()
+                else:
+                    response_data_json = json.dumps(response_data)
 
                 cursor.execute("""
                     INSERT OR REPLACE INTO llm_cache
@@ -244,7 +333,7 @@ class LLMCache:
             Number of entries deleted
         """
         try:
-            with sqlite3.connect(self.cache_file) as conn:
+            with self._lock, self._connection() as conn:
                 cursor = conn.cursor()
 
                 if prompt_type and mpn:
@@ -283,7 +372,7 @@ class LLMCache:
             Number of entries deleted
         """
         try:
-            with sqlite3.connect(self.cache_file) as conn:
+            with self._lock, self._connection() as conn:
                 cursor = conn.cursor()
 
                 cutoff_time = time.time() - self.ttl_seconds
@@ -313,7 +402,7 @@ class LLMCache:
             Dictionary with cache statistics
         """
         try:
-            with sqlite3.connect(self.cache_file) as conn:
+            with self._lock, self._connection() as conn:
                 cursor = conn.cursor()
 
                 # Total entries
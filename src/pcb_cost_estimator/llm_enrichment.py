@@ -6,6 +6,7 @@ the deterministic cost model with AI-powered analysis.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -17,6 +18,14 @@ from .prompt_templates import PromptTemplateManager, get_template_manager
 
 logger = logging.getLogger(__name__)
 
+# LLM category names -> enum, including synonyms the models tend to answer with.
+# ComponentCategory has no sensor member, so sensors are reported as OTHER.
+_CATEGORY_BY_NAME: Dict[str, ComponentCategory] = {
+    **{category.value: category for category in ComponentCategory},
+    "oscillator": ComponentCategory.CRYSTAL,
+    "sensor": ComponentCategory.OTHER,
+}
+
 
 class ComponentClassificationResult(BaseModel):
     """Result from LLM-powered component classification."""
@@ -399,7 +408,7 @@ class LLMEnrichmentService:
                 additional_context=cache_key_context
             )
 
-            if result.obsolescence_risk in ["high", "obsolete"]:
+            if result.obsolescence_risk in {"high", "obsolete"}:
                 logger.warning(
                     f"Obsolescence risk detected for {mpn}: {result.obsolescence_risk}"
                 )
@@ -412,22 +421,26 @@ class LLMEnrichmentService:
 
     def batch_check_obsolescence(
         self,
-        components: List[Dict[str, Any]]
+        components: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
     ) -> List[ObsolescenceRisk]:
         """
         Check obsolescence for multiple components.
 
+        Checks are I/O-bound API calls, so they run concurrently on a thread
+        pool. The provider's rate limiter still applies across threads.
+
         Args:
             components: List of component dictionaries with keys:
                        mpn, manufacturer, description, category, quantity
+            max_workers: Maximum concurrent checks (default: ThreadPoolExecutor's
+                         default; 1 checks sequentially)
 
         Returns:
-            List of ObsolescenceRisk results
+            List of ObsolescenceRisk results, in input order
         """
-        results = []
-
-        for component in components:
-            result = self.check_obsolescence(
+        def check(component: Dict[str, Any]) -> Optional[ObsolescenceRisk]:
+            return self.check_obsolescence(
                 mpn=component.get("mpn", ""),
                 manufacturer=component.get("manufacturer", ""),
                 description=component.get("description", ""),
@@ -435,35 +448,18 @@ class LLMEnrichmentService:
                 quantity=component.get("quantity", 1)
             )
 
-            if result:
-                results.append(result)
+        if max_workers == 1 or len(components) <= 1:
+            results = [check(component) for component in components]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(check, components))
 
-        return results
+        return [result for result in results if result]
 
     @staticmethod
     def _parse_category(category_str: str) -> ComponentCategory:
         """Parse category string to ComponentCategory enum."""
-        category_map = {
-            "resistor": ComponentCategory.RESISTOR,
-            "capacitor": ComponentCategory.CAPACITOR,
-            "inductor": ComponentCategory.INDUCTOR,
-            "ic": ComponentCategory.IC,
-            "connector": ComponentCategory.CONNECTOR,
-            "diode": ComponentCategory.DIODE,
-            "transistor": ComponentCategory.TRANSISTOR,
-            "led": ComponentCategory.LED,
-            "crystal": ComponentCategory.CRYSTAL,
-            "oscillator": ComponentCategory.CRYSTAL,
-            "switch": ComponentCategory.SWITCH,
-            "relay": ComponentCategory.RELAY,
-            "fuse": ComponentCategory.FUSE,
-            "transformer": ComponentCategory.TRANSFORMER,
-            "sensor": ComponentCategory.SENSOR,
-            "other": ComponentCategory.OTHER,
-            "unknown": ComponentCategory.UNKNOWN,
-        }
-
-        return category_map.get(category_str.lower(), ComponentCategory.UNKNOWN)
+        return _CATEGORY_BY_NAME.get(category_str.lower(), ComponentCategory.UNKNOWN)
 
 
 def create_enrichment_service(
@@ -7,6 +7,7 @@ for component enrichment, price checking, and obsolescence detection.
 
 import json
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
@@ -38,24 +39,30 @@ class RateLimiter:
         self.tokens = requests_per_minute
         self.last_update = time.time()
         self.lock_time = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
 
     def acquire(self) -> None:
-        """Block until a request token is available."""
-        now = time.time()
-        time_passed = now - self.last_update
-        self.tokens = min(
-            self.requests_per_minute,
-            self.tokens + time_passed * (self.requests_per_minute / 60.0)
-        )
-        self.last_update = now
+        """Block until a request token is available.
 
-        if self.tokens < 1:
-            sleep_time = (1 - self.tokens) * (60.0 / self.requests_per_minute)
-            logger.debug(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-            self.tokens = 1
+        Safe to call from several threads; waiting callers queue on the lock.
+        """
+        with self._lock:
+            now = time.time()
+            time_passed = now - self.last_update
+            self.tokens = min(
+                self.requests_per_minute,
+                self.tokens + time_passed * (self.requests_per_minute / 60.0)
+            )
+            self.last_update = now
+
+            if self.tokens < 1:
+                sleep_time = (1 - self.tokens) * (60.0 / self.requests_per_minute)
+                logger.debug(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
+                time.sleep(sleep_time)
+                self.tokens = 1
+                self.last_update = time.time()
 
-        self.tokens -= 1
+            self.tokens -= 1
 
 
 class LLMProvider(ABC):
@@ -11,6 +11,12 @@ from typing import Dict, Optional
 import yaml
 from pydantic import BaseModel, Field
 
+# Use the LibYAML bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,7 +83,7 @@ class PromptTemplateManager:
 
         try:
             with open(template_file, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YamlLoader)
 
             template = PromptTemplate(**data)
             self._cache[cache_key] = template
@@ -418,12 +418,17 @@ class CostReportGenerator:
                 self.console.print(f"  ... and {len(self.cost_estimate.notes) - 5} more")
             self.console.print()
 
-    def generate_json_report(self, output_path: Optional[Path] = None) -> Dict[str, Any]:
+    def generate_json_report(
+        self,
+        output_path: Optional[Path] = None,
+        buffer_size: int = -1
+    ) -> Dict[str, Any]:
         """
         Generate detailed JSON report with full breakdown.
 
         Args:
             output_path: Optional path to write JSON file
+            buffer_size: Write buffer size in bytes (-1 uses the platform default)
 
         Returns:
             Dict containing complete report data
@@ -537,22 +542,23 @@ class CostReportGenerator:
 
         if output_path:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
+            with open(output_path, 'w', buffering=buffer_size) as f:
                 json.dump(report, f, indent=2)
             logger.info(f"JSON report written to {output_path}")
 
         return report
 
-    def generate_csv_export(self, output_path: Path) -> None:
+    def generate_csv_export(self, output_path: Path, buffer_size: int = -1) -> None:
         """
         Generate CSV export for spreadsheet analysis.
 
         Args:
             output_path: Path to write CSV file
+            buffer_size: Write buffer size in bytes (-1 uses the platform default)
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', newline='') as f:
+        with open(output_path, 'w', newline='', buffering=buffer_size) as f:
             writer = csv.writer(f)
 
             # Header
@@ -641,12 +647,13 @@ class CostReportGenerator:
 
         logger.info(f"CSV export written to {output_path}")
 
-    def generate_markdown_report(self, output_path: Path) -> None:
+    def generate_markdown_report(self, output_path: Path, buffer_size: int = -1) -> None:
         """
         Generate Markdown report for documentation.
 
         Args:
             output_path: Path to write Markdown file
+            buffer_size: Write buffer size in bytes (-1 uses the platform default)
         """
         volume_costs = self._calculate_volume_costs()
         category_costs = self._calculate_cost_by_category()
@@ -656,7 +663,7 @@ class CostReportGenerator:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as f:
+        with open(output_path, 'w', buffering=buffer_size) as f:
             # Header
             f.write("# PCB Cost Estimate Report\n\n")
             f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n")
@@ -784,7 +791,8 @@ class CostReportGenerator:
 def generate_report(
     cost_estimate: CostEstimate,
     format: str = 'table',
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    buffer_size: int = -1
 ) -> Optional[Dict[str, Any]]:
     """
     Generate cost report in specified format.
@@ -793,6 +801,8 @@ def generate_report(
         cost_estimate: Complete cost estimate
         format: Output format ('table', 'json', 'csv', 'markdown')
         output_path: Optional output file path
+        buffer_size: Write buffer size in bytes for file-backed formats
+            (-1 uses the platform default)
 
     Returns:
         Dict for JSON format, None for others
@@ -803,16 +813,16 @@ def generate_report(
         generator.generate_cli_table()
         return None
     elif format == 'json':
-        return generator.generate_json_report(output_path)
+        return generator.generate_json_report(output_path, buffer_size)
     elif format == 'csv':
         if not output_path:
             raise ValueError("output_path required for CSV format")
-        generator.generate_csv_export(output_path)
+        generator.generate_csv_export(output_path, buffer_size)
         return None
     elif format == 'markdown':
         if not output_path:
             raise ValueError("output_path required for Markdown format")
-        generator.generate_markdown_report(output_path)
+        generator.generate_markdown_report(output_path, buffer_size)
         return None
     else:
         raise ValueError(f"Unknown format: {format}")
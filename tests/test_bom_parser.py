@@ -39,6 +39,26 @@ class TestColumnMatcher:
         assert ColumnMatcher.find_best_match("ABCDEFG") is None
         assert ColumnMatcher.find_best_match("Random Column") is None
 
+    @pytest.mark.parametrize(
+        "column",
+        ["Ref Des", "Qty", "Mfr", "Part No", "Mfr. P/N", "Footprint", "Desc", "Random Column"],
+    )
+    def test_rapidfuzz_matches_difflib(self, column, monkeypatch):
+        """Test that the rapidfuzz fast path agrees with the difflib fallback."""
+        pytest.importorskip("rapidfuzz")
+        from pcb_cost_estimator import bom_parser
+
+        # Results are cached per name, so clear the cache when switching backends
+        monkeypatch.setattr(bom_parser, "RAPIDFUZZ_AVAILABLE", True)
+        bom_parser._match_column_name.cache_clear()
+        fast = ColumnMatcher.find_best_match(column)
+        monkeypatch.setattr(bom_parser, "RAPIDFUZZ_AVAILABLE", False)
+        bom_parser._match_column_name.cache_clear()
+        fallback = ColumnMatcher.find_best_match(column)
+        bom_parser._match_column_name.cache_clear()
+
+        assert fast == fallback
+
     def test_map_columns(self):
         """Test mapping a list of columns."""
         columns = ["Ref Des", "Qty", "Manufacturer", "Part Number", "Description"]
@@ -50,6 +70,20 @@ class TestColumnMatcher:
         assert mapping["Part Number"] == "manufacturer_part_number"
         assert mapping["Description"] == "description"
 
+    def test_subclass_column_patterns(self):
+        """Test that a subclass matches against its own column patterns."""
+
+        class GermanMatcher(ColumnMatcher):
+            COLUMN_PATTERNS = {
+                **ColumnMatcher.COLUMN_PATTERNS,
+                "manufacturer": ["hersteller"],
+            }
+
+        assert ColumnMatcher.find_best_match("Hersteller") is None
+        assert GermanMatcher.find_best_match("Hersteller") == "manufacturer"
+        assert ColumnMatcher.find_best_match("Mfr") == "manufacturer"
+        assert GermanMatcher.find_best_match("Mfr") != "manufacturer"
+
 
 class TestBomParser:
     """Test the BoM parser."""
@@ -98,6 +132,25 @@ C10\t1\tSamsung\tCL10A105\tCapacitor\t0603\t1uF
         assert result.items[0].manufacturer_part_number == "CRCW0805100K"
         assert result.items[0].category == ComponentCategory.RESISTOR
 
+    def test_parse_csv_in_chunks(self, parser, sample_csv_path):
+        """Test that chunked reading gives the same result as a whole-file read."""
+        chunked = BomParser(chunksize=2).parse_file(sample_csv_path)
+        whole = parser.parse_file(sample_csv_path)
+
+        assert chunked.model_dump() == whole.model_dump()
+        assert [item.line_number for item in chunked.items] == [1, 2, 3]
+
+    def test_parse_files(self, parser, sample_csv_path, sample_tsv_path):
+        """Test that parse_files matches parse_file for each path, in order."""
+        paths = [sample_csv_path, sample_tsv_path]
+
+        results = parser.parse_files(paths, max_workers=2)
+
+        assert [r.file_path for r in results] == [str(p) for p in paths]
+        assert [r.model_dump() for r in results] == [
+            parser.parse_file(p).model_dump() for p in paths
+        ]
+
     def test_parse_tsv(self, parser, sample_tsv_path):
         """Test parsing a TSV file."""
         result = parser.parse_file(sample_tsv_path)
@@ -146,6 +199,27 @@ R1,1,RC0805
         assert result.item_count == 1
         assert result.items[0].reference_designator == "R1"
 
+    def test_header_detection_xlsx(self, parser, tmp_path):
+        """Test header detection in a workbook with preamble rows."""
+        openpyxl = pytest.importorskip("openpyxl")
+
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["Project: Test Board"])
+        sheet.append(["Date: 2024-01-01"])
+        sheet.append([])
+        sheet.append(["Ref Des", "Qty", "Part Number"])
+        sheet.append(["R1", 1, "RC0805FR-0710KL"])
+        sheet.append(["C1", 2, "GRM21BR71C104KA01L"])
+        xlsx_file = tmp_path / "with_header.xlsx"
+        workbook.save(xlsx_file)
+
+        result = parser.parse_file(xlsx_file)
+
+        assert result.success
+        assert [item.reference_designator for item in result.items] == ["R1", "C1"]
+        assert result.items[1].quantity == 2
+
     def test_category_inference_from_ref_des(self, parser, tmp_path):
         """Test category inference from reference designator."""
         csv_content = """Ref,Qty
@@ -177,6 +251,70 @@ SW1,1
         assert result.items[8].category == ComponentCategory.CRYSTAL
         assert result.items[9].category == ComponentCategory.SWITCH
 
+    def test_category_column(self, parser, tmp_path):
+        """Test that category cells must name a category exactly."""
+        csv_content = """Ref,Qty,Category
+X1,1,Capacitor
+X2,1,Logic
+X3,1,
+"""
+        csv_file = tmp_path / "category_column.csv"
+        csv_file.write_text(csv_content)
+
+        result = parser.parse_file(csv_file)
+
+        assert result.success
+        assert result.items[0].category == ComponentCategory.CAPACITOR
+        # Unrecognised or blank cells fall back to inference from the reference
+        assert result.items[1].category == ComponentCategory.CRYSTAL
+        assert result.items[2].category == ComponentCategory.CRYSTAL
+
+    def test_quantity_parsing(self, parser, tmp_path):
+        """Test that quantities are truncated and blank/invalid values default to 1."""
+        csv_content = """Ref Des,Qty,Description
+R1,2.7,Resistor
+R2,,Resistor
+R3,abc,Resistor
+R4,-1,Resistor
+"""
+        csv_file = tmp_path / "quantities.csv"
+        csv_file.write_text(csv_content)
+
+        result = parser.parse_file(csv_file)
+
+        quantities = {item.reference_designator: item.quantity for item in result.items}
+        assert quantities == {"R1": 2, "R2": 1, "R3": 1}
+        assert len(result.warnings) == 1
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "10k ohm resistor",
+            "n-channel mosfet",
+            "ldo regulator ic",
+            "usb connector header",
+            "red led",
+            "dnp",
+            "",
+        ],
+    )
+    def test_keyword_scanner_matches_fallback(self, text, monkeypatch):
+        """Test that the Aho-Corasick scanner agrees with the substring fallback."""
+        pytest.importorskip("ahocorasick")
+        from pcb_cost_estimator import keyword_scanner
+
+        keywords = [
+            (keyword, category)
+            for category, words in BomParser.CATEGORY_KEYWORDS.items()
+            for keyword in words
+        ]
+        monkeypatch.setattr(keyword_scanner, "AHOCORASICK_AVAILABLE", True)
+        fast = keyword_scanner.KeywordScanner(keywords).find(text)
+        monkeypatch.setattr(keyword_scanner, "AHOCORASICK_AVAILABLE", False)
+        fallback = keyword_scanner.KeywordScanner(keywords).find(text)
+
+        assert fast == fallback
+
     def test_malformed_rows_warning(self, parser, tmp_path):
         """Test handling of malformed rows."""
         csv_content = """Ref,Qty,Desc
@@ -210,6 +348,7 @@ R3,abc,Bad quantity
 
         assert not result.success
         assert "unsupported" in result.errors[0].lower()
+        assert result.errors[0].endswith("Supported: .csv, .tsv, .xls, .xlsx")
 
 
 class TestBomItem:
@@ -1,8 +1,20 @@
 """Tests for configuration management."""
 
+import os
+
 import pytest
+import yaml
 from pathlib import Path
-from pcb_cost_estimator.config import Config, APIConfig, PricingConfig, LoggingConfig
+from pcb_cost_estimator import config as config_module
+from pcb_cost_estimator.config import (
+    Config,
+    APIConfig,
+    PricingConfig,
+    LoggingConfig,
+    load_config,
+    load_cost_model_config,
+    save_config,
+)
 
 
 def test_api_config_defaults():
@@ -46,3 +58,55 @@ def test_invalid_log_level():
     """Test invalid log level raises ValueError."""
     with pytest.raises(ValueError):
         LoggingConfig(level="INVALID")
+
+
+def test_load_config_reloads_modified_file(tmp_path):
+    """Test that load_config picks up changes and returns independent copies."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("pricing:\n  markup_percentage: 10.0\n")
+
+    first = load_config(config_file)
+    first["pricing"]["markup_percentage"] = 99.0
+    assert load_config(config_file)["pricing"]["markup_percentage"] == 10.0
+
+    config_file.write_text("pricing:\n  markup_percentage: 30.0\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_config(config_file)["pricing"]["markup_percentage"] == 30.0
+
+
+def test_save_config_invalidates_load_cache(tmp_path):
+    """Test that load_config sees a save even if mtime and size are unchanged."""
+    config_file = tmp_path / "config.yaml"
+    save_config({"pricing": {"markup_percentage": 10.0}}, config_file)
+    stat = config_file.stat()
+    assert load_config(config_file)["pricing"]["markup_percentage"] == 10.0
+
+    save_config({"pricing": {"markup_percentage": 30.0}}, config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert config_file.stat().st_size == stat.st_size
+    assert load_config(config_file)["pricing"]["markup_percentage"] == 30.0
+
+
+def test_load_cost_model_config(tmp_path):
+    """Test loading a cost model file and that callers get independent copies."""
+    cost_model_file = tmp_path / "cost_model.yaml"
+    cost_model_file.write_text(
+        "category_pricing:\n"
+        "  resistor:\n"
+        "    base_price_low: 0.001\n"
+        "    base_price_typical: 0.005\n"
+        "    base_price_high: 0.02\n"
+    )
+
+    first = load_cost_model_config(cost_model_file)
+    assert first.category_pricing["resistor"].base_price_typical == 0.005
+
+    first.category_pricing.clear()
+    assert "resistor" in load_cost_model_config(cost_model_file).category_pricing
+
+
+def test_libyaml_available_flag():
+    """Test LIBYAML_AVAILABLE reports whether the LibYAML loader is used."""
+    _, loader, _ = config_module._yaml()
+    assert config_module.LIBYAML_AVAILABLE is (loader is getattr(yaml, "CSafeLoader", None))
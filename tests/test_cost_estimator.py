@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import Mock
 
 from pcb_cost_estimator.models import (
     BomItem,
@@ -89,6 +90,23 @@ class TestComponentClassifier:
         category = classifier.classify_component(item)
         assert category == ComponentCategory.IC
 
+    def test_classify_duplicate_parts_once(self):
+        """Test that repeated parts reuse the cached rule-based classification."""
+        classifier = ComponentClassifier()
+        items = [
+            BomItem(
+                reference_designator=f"R{i}",
+                quantity=1,
+                manufacturer_part_number="RC0603FR-0710KL",
+            )
+            for i in range(1, 6)
+        ]
+
+        results = [classifier.classify_component(item) for item in items]
+
+        assert results == [(ComponentCategory.RESISTOR, None)] * 5
+        assert classifier._classify_by_rules.cache_info().misses == 1
+
     def test_classify_by_description(self):
         """Test classification by description keywords."""
         classifier = ComponentClassifier()
@@ -206,6 +224,22 @@ class TestPackageClassifier:
         pkg_type = classifier.classify_package(item)
         assert pkg_type == PackageType.CONNECTOR
 
+    def test_subclass_package_patterns(self):
+        """Test that a subclass matches against its own package patterns."""
+
+        class SotClassifier(PackageClassifier):
+            PACKAGE_PATTERNS = {
+                **PackageClassifier.PACKAGE_PATTERNS,
+                PackageType.SOIC: [r"^SOT"],
+            }
+
+        item = BomItem(reference_designator="Q1", quantity=1, package="SOT-23")
+        assert PackageClassifier().classify_package(item) == PackageType.UNKNOWN
+        assert SotClassifier().classify_package(item) == PackageType.SOIC
+        item = BomItem(reference_designator="U1", quantity=1, package="TSSOP-16")
+        assert PackageClassifier().classify_package(item) == PackageType.SOIC
+        assert SotClassifier().classify_package(item) == PackageType.UNKNOWN
+
 
 class TestCostEstimator:
     """Test cost estimation."""
@@ -395,6 +429,140 @@ class TestCostEstimator:
         assert overhead.supply_chain_risk_factor >= 1.0
         assert overhead.total_overhead > 0
 
+    def test_pricing_follows_config_changes(self, basic_config):
+        """Test that pricing changes made after construction are used."""
+        estimator = CostEstimator(basic_config)
+
+        basic_config.category_pricing["resistor"] = CategoryPricing(
+            base_price_low=0.01,
+            base_price_typical=0.05,
+            base_price_high=0.2,
+        )
+        basic_config.package_pricing["smd_small"] = PackagePricing(multiplier=2.0)
+
+        pricing = estimator._get_category_pricing(ComponentCategory.RESISTOR)
+        assert pricing.base_price_typical == 0.05
+        assert estimator._get_package_multiplier(PackageType.SMD_SMALL) == 2.0
+
+    def test_prepare_reused_across_quantities(self, basic_config):
+        """Test that a prepared BoM yields the same estimate as estimate_bom_cost."""
+        estimator = CostEstimator(basic_config)
+
+        items = [
+            BomItem(reference_designator="R1", quantity=10, category=ComponentCategory.RESISTOR),
+            BomItem(reference_designator="U1", quantity=1, category=ComponentCategory.IC),
+        ]
+
+        bom_result = BomParseResult(items=items)
+        prepared = estimator.prepare(bom_result)
+
+        for board_quantity in [1, 100]:
+            direct = estimator.estimate_bom_cost(bom_result, board_quantity=board_quantity)
+            reused = estimator.apply(prepared, board_quantity=board_quantity)
+            assert len(reused.component_costs) == len(items)
+            assert reused.model_dump(exclude={"timestamp"}) == direct.model_dump(
+                exclude={"timestamp"}
+            )
+
+            # Tier totals follow the default discount curve
+            resistor = reused.component_costs[0]
+            assert [pb.quantity for pb in resistor.price_breaks] == [1, 10, 100, 1000, 10000]
+            assert [pb.total_price for pb in resistor.price_breaks] == pytest.approx(
+                [0.05, 0.425, 3.5, 27.5, 225.0]
+            )
+
+            # Estimates are independent copies of the prepared components
+            resistor.price_breaks.clear()
+            resistor.unit_cost_typical = 0.0
+
+        assert prepared.component_costs[0].unit_cost_typical == 0.005
+        assert len(prepared.component_costs[0].price_breaks) == 5
+
+    def test_batch_pricing_per_category_and_package(self, basic_config):
+        """Test batch estimates price each category and package from the config."""
+        estimator = CostEstimator(basic_config)
+
+        items = [
+            BomItem(reference_designator=ref_des, quantity=qty, category=category, package=package)
+            for ref_des, qty, category, package in [
+                ("R1", 10, ComponentCategory.RESISTOR, "0603"),
+                ("C1", 4, ComponentCategory.CAPACITOR, "0805"),
+                ("U1", 1, ComponentCategory.IC, "BGA-256"),
+                ("R2", 2, ComponentCategory.RESISTOR, "0603"),
+            ]
+        ]
+        component_costs, warnings = estimator._estimate_component_costs(items)
+
+        assert not warnings
+        expected = {
+            "R1": (PackageType.SMD_SMALL, (0.001, 0.005, 0.02), 0.05),
+            "C1": (PackageType.SMD_MEDIUM, (0.002, 0.01, 0.05), 0.04),
+            "U1": (PackageType.BGA, (1.0, 4.0, 20.0), 4.0),
+            "R2": (PackageType.SMD_SMALL, (0.001, 0.005, 0.02), 0.01),
+        }
+        discounts = [1.0, 0.85, 0.70, 0.55, 0.45]
+        for comp, item in zip(component_costs, items):
+            package_type, unit_costs, total_typical = expected[comp.reference_designator]
+            assert comp.package_type == package_type
+            assert (
+                comp.unit_cost_low, comp.unit_cost_typical, comp.unit_cost_high
+            ) == pytest.approx(unit_costs)
+            assert comp.total_cost_typical == pytest.approx(total_typical)
+            assert [pb.unit_price for pb in comp.price_breaks] == pytest.approx(
+                [unit_costs[1] * discount for discount in discounts]
+            )
+            assert [pb.total_price for pb in comp.price_breaks] == pytest.approx(
+                [pb.unit_price * item.quantity * pb.quantity for pb in comp.price_breaks]
+            )
+
+    def test_llm_checks_once_per_part(self, basic_config):
+        """Test that repeated parts are sent to the LLM checks only once."""
+        llm_enrichment = Mock(enabled=True)
+        llm_enrichment.check_price_reasonableness.return_value = None
+        llm_enrichment.batch_check_obsolescence.return_value = []
+        estimator = CostEstimator(basic_config, llm_enrichment=llm_enrichment)
+
+        items = [
+            BomItem(
+                reference_designator=f"R{i}",
+                quantity=1,
+                manufacturer_part_number="RC0603FR-0710KL",
+            )
+            for i in range(1, 4)
+        ]
+        estimator.prepare(BomParseResult(items=items))
+
+        assert llm_enrichment.check_price_reasonableness.call_count == 1
+        (components,), _ = llm_enrichment.batch_check_obsolescence.call_args
+        assert [component["mpn"] for component in components] == ["RC0603FR-0710KL"]
+
+    def test_llm_estimates_run_concurrently_in_order(self, basic_config):
+        """Test threaded estimation keeps item order and one price check per part."""
+        llm_enrichment = Mock(enabled=True)
+        llm_enrichment.check_price_reasonableness.return_value = None
+        estimator = CostEstimator(basic_config, llm_enrichment=llm_enrichment, max_workers=4)
+
+        items = [
+            BomItem(
+                reference_designator=f"R{i}",
+                quantity=1,
+                manufacturer_part_number=["RC0603FR-0710KL", "GRM188R71C104KA01D"][i % 2],
+            )
+            for i in range(1, 9)
+        ]
+        component_costs, warnings = estimator._estimate_component_costs(items)
+
+        assert not warnings
+        assert len(component_costs) == len(items)
+        assert [comp.reference_designator for comp in component_costs] == [
+            item.reference_designator for item in items
+        ]
+        assert [comp.unit_cost_typical for comp in component_costs] == [0.01, 0.005] * 4
+        assert (component_costs, warnings) == CostEstimator(
+            basic_config
+        )._estimate_component_costs(items)
+        assert llm_enrichment.check_price_reasonableness.call_count == 2
+
     def test_confidence_intervals(self, basic_config):
         """Test that cost estimates include low/typical/high values."""
         estimator = CostEstimator(basic_config)
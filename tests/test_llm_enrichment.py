@@ -1,6 +1,7 @@
 """Tests for LLM enrichment functionality."""
 
 import json
+import sqlite3
 from unittest.mock import Mock, MagicMock, patch
 import pytest
 
@@ -148,6 +149,41 @@ class TestLLMCache:
 
         assert cached_data == response_data
 
+    def test_cache_uses_wal(self, tmp_path):
+        """Test that the cache database is switched to write-ahead logging."""
+        cache_file = tmp_path / "test_cache.db"
+        LLMCache(cache_file=cache_file)
+
+        with sqlite3.connect(cache_file) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_cache_reopens_after_close(self, tmp_path):
+        """Test that the shared connection is reopened after close()."""
+        cache = LLMCache(cache_file=tmp_path / "test_cache.db")
+        cache.set("classification", "LM358", {"category": "ic"})
+
+        cache.close()
+
+        assert cache.get("classification", "LM358") == {"category": "ic"}
+        cache.close()
+
+    def test_cache_hit_defers_access_time(self, tmp_path):
+        """Test that cache hits do not write until the access times are flushed."""
+        cache_file = tmp_path / "test_cache.db"
+        cache = LLMCache(cache_file=cache_file)
+        cache.set("classification", "LM358", {"category": "ic"})
+        changes = cache._conn.total_changes
+
+        assert cache.get("classification", "LM358") == {"category": "ic"}
+        assert cache._conn.total_changes == changes
+        (accessed_at,) = cache._pending_access.values()
+
+        cache.close()
+
+        with sqlite3.connect(cache_file) as conn:
+            row = conn.execute("SELECT last_accessed_at FROM llm_cache").fetchone()
+        assert row[0] == accessed_at
+
     def test_cache_miss(self, tmp_path):
         """Test cache miss."""
         cache = LLMCache(cache_file=tmp_path / "test_cache.db")
@@ -159,6 +195,16 @@ class TestLLMCache:
 
         assert cached_data is None
 
+    def test_cache_key_normalizes_mpn(self, tmp_path):
+        """Test that cache keys ignore MPN case and surrounding whitespace."""
+        cache = LLMCache(cache_file=tmp_path / "test_cache.db")
+
+        key = cache._generate_cache_key("classification", "rc0603fr-0710kl ")
+
+        assert key == cache._generate_cache_key("classification", "RC0603FR-0710KL")
+        assert key != cache._generate_cache_key("price_check", "RC0603FR-0710KL")
+        assert key != cache._generate_cache_key("classification", "RC0603FR-0710KL", "ctx")
+
     def test_cache_clear(self, tmp_path):
         """Test clearing cache."""
         cache = LLMCache(cache_file=tmp_path / "test_cache.db")
@@ -388,6 +434,7 @@ class TestLLMEnrichmentService:
         results = service.batch_check_obsolescence(components)
 
         assert len(results) == 2
+        assert [result.mpn for result in results] == ["PART1", "PART2"]
         for result in results:
             assert result.obsolescence_risk == "low"
             assert result.lifecycle_status == "active"
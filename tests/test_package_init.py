@@ -0,0 +1,37 @@
+"""Tests for the package-level lazy exports."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pcb_cost_estimator
+
+
+@pytest.mark.parametrize("name", pcb_cost_estimator.__all__)
+def test_public_symbol_resolves(name):
+    """Every name in __all__ resolves to an object defined in a submodule."""
+    value = getattr(pcb_cost_estimator, name)
+    assert value.__name__ == name
+    assert name in dir(pcb_cost_estimator)
+
+
+def test_unknown_attribute_raises():
+    """Unknown attributes raise AttributeError rather than ImportError."""
+    with pytest.raises(AttributeError):
+        pcb_cost_estimator.DoesNotExist
+
+
+def test_import_does_not_load_submodules():
+    """Importing the package alone must not import the heavy submodules."""
+    code = (
+        "import sys, pcb_cost_estimator; "
+        "print(any(m in sys.modules for m in ("
+        "'pcb_cost_estimator.bom_parser', 'pcb_cost_estimator.cost_estimator')))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    ).stdout
+    assert output.strip() == "False"
@@ -392,6 +392,27 @@ def test_generate_report_markdown_format(sample_cost_estimate):
         assert output_path.exists()
 
 
+@pytest.mark.parametrize("format,suffix", [("json", "json"), ("csv", "csv"), ("markdown", "md")])
+def test_generate_report_buffer_size(sample_cost_estimate, format, suffix):
+    """Test that a custom write buffer produces the same file as the default."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        default_path = Path(tmpdir) / f"default.{suffix}"
+        buffered_path = Path(tmpdir) / f"buffered.{suffix}"
+        generate_report(sample_cost_estimate, format=format, output_path=default_path)
+        generate_report(
+            sample_cost_estimate, format=format, output_path=buffered_path, buffer_size=1 << 20
+        )
+
+        # JSON and Markdown embed a generation timestamp, so ignore those lines
+        def content(path):
+            return [
+                line for line in path.read_text().splitlines()
+                if "generated_at" not in line and "**Generated:**" not in line
+            ]
+
+        assert content(buffered_path) == content(default_path)
+
+
 def test_generate_report_invalid_format(sample_cost_estimate):
     """Test generate_report with invalid format."""
     with pytest.raises(ValueError, match="Unknown format"):